@@ -2,10 +2,14 @@
 import numpy as np
 
 try:
-    from .numba_helpers import update_positions_numba
+    from .numba_helpers import (update_positions_numba, avancer_vehicules_numba, avancer_routes_numba,
+                                avancer_n_pas_numba)
     NUMBA_AVAILABLE = True
 except Exception:
     update_positions_numba = None
+    avancer_vehicules_numba = None
+    avancer_routes_numba = None
+    avancer_n_pas_numba = None
     NUMBA_AVAILABLE = False
 
 import random
@@ -65,3 +69,103 @@ def update_positions(positions, speeds, limits, lengths, densities, delta_t):
     else:
         new_positions, new_speeds = update_positions_py(list(pos), list(spd), list(lim), list(lng), list(den), delta_t)
         return np.array(new_positions, dtype=np.float64), np.array(new_speeds, dtype=np.float64)
+
+
+def avancer_vehicules_np(positions, vitesses_ms, positions_feux, feux_bloquants, longueur, dt, marge):
+    """
+    Vectorized NumPy fallback for avancer_vehicules_numba (same semantics).
+    The next blocking light of every vehicle is found with one np.searchsorted
+    call on the sorted positions of the red/orange lights.
+    """
+    distance = vitesses_ms * dt
+
+    obstacles = positions_feux[feux_bloquants == 1]
+    if obstacles.shape[0] > 0:
+        # index of the first blocking light strictly ahead of each vehicle
+        idx = np.searchsorted(obstacles, positions, side='right')
+        devant = idx < obstacles.shape[0]
+        prochain = obstacles[np.minimum(idx, obstacles.shape[0] - 1)]
+        gene = devant & (prochain <= positions + distance)
+        distance = np.where(gene, np.minimum(distance, np.maximum(0.0, prochain - positions - marge)), distance)
+
+    distance = np.minimum(distance, np.maximum(0.0, longueur - positions))
+    nouvelles_positions = np.where(distance > 0.0, positions + distance, positions)
+    sortis = (nouvelles_positions >= longueur).astype(np.int8)
+    return nouvelles_positions, sortis
+
+def avancer_vehicules(positions, vitesses_ms, positions_feux, feux_bloquants, longueur, dt, marge=5.0):
+    """
+    Wrapper: advance the vehicles of one route by dt, with Numba if available.
+    positions_feux must be sorted ascending, feux_bloquants aligned with it.
+    Returns (positions_array, sortis_array) as numpy arrays.
+    """
+    pos = np.ascontiguousarray(np.array(positions, dtype=np.float64))
+    vit = np.ascontiguousarray(np.array(vitesses_ms, dtype=np.float64))
+    feux = np.ascontiguousarray(np.array(positions_feux, dtype=np.float64))
+    bloquants = np.ascontiguousarray(np.array(feux_bloquants, dtype=np.int8))
+
+    if NUMBA_AVAILABLE:
+        sortis = np.zeros(pos.shape[0], dtype=np.int8)
+        avancer_vehicules_numba(pos, vit, feux, bloquants, float(longueur), float(dt), float(marge), sortis)
+        return pos, sortis
+    else:
+        return avancer_vehicules_np(pos, vit, feux, bloquants, float(longueur), float(dt), float(marge))
+
+def avancer_routes(positions, vitesses_ms, bornes_vehicules, longueurs, marges,
+                   positions_feux, feux_bloquants, bornes_feux, dt):
+    """
+    Wrapper: advance the vehicles of several routes by dt in one call.
+    Arrays are the concatenation of the per-route arrays of avancer_vehicules;
+    route k owns the slices bornes_vehicules[k]:bornes_vehicules[k + 1] and
+    bornes_feux[k]:bornes_feux[k + 1].
+    Returns (positions_array, sortis_array) as numpy arrays.
+    """
+    pos = np.ascontiguousarray(np.array(positions, dtype=np.float64))
+    vit = np.ascontiguousarray(np.array(vitesses_ms, dtype=np.float64))
+    bornes_v = np.ascontiguousarray(np.array(bornes_vehicules, dtype=np.int64))
+    lng = np.ascontiguousarray(np.array(longueurs, dtype=np.float64))
+    mrg = np.ascontiguousarray(np.array(marges, dtype=np.float64))
+    feux = np.ascontiguousarray(np.array(positions_feux, dtype=np.float64))
+    bloquants = np.ascontiguousarray(np.array(feux_bloquants, dtype=np.int8))
+    bornes_f = np.ascontiguousarray(np.array(bornes_feux, dtype=np.int64))
+    sortis = np.zeros(pos.shape[0], dtype=np.int8)
+
+    if NUMBA_AVAILABLE:
+        avancer_routes_numba(pos, vit, bornes_v, lng, mrg, feux, bloquants, bornes_f, float(dt), sortis)
+    else:
+        for k in range(lng.shape[0]):
+            a, b = bornes_v[k], bornes_v[k + 1]
+            f, g = bornes_f[k], bornes_f[k + 1]
+            pos[a:b], sortis[a:b] = avancer_vehicules_np(pos[a:b], vit[a:b], feux[f:g], bloquants[f:g],
+                                                         lng[k], float(dt), mrg[k])
+    return pos, sortis
+
+def avancer_n_pas(positions, vitesses_ms, positions_feux, durees_feux, etats_feux, temps_feux,
+                  longueur, dt, n_pas, marge=5.0):
+    """
+    Wrapper: advance one route over n_pas steps of dt, lights included, in one call.
+    durees_feux is (n_feux, 3) with the (rouge, vert, orange) durations, etats_feux
+    the index of each light's current state and temps_feux its elapsed time.
+    Returns (positions_array, sortis_array, etats_array, temps_array) as numpy arrays.
+    """
+    pos = np.ascontiguousarray(np.array(positions, dtype=np.float64))
+    vit = np.ascontiguousarray(np.array(vitesses_ms, dtype=np.float64))
+    feux = np.ascontiguousarray(np.array(positions_feux, dtype=np.float64))
+    durees = np.ascontiguousarray(np.array(durees_feux, dtype=np.float64).reshape(-1, 3))
+    etats = np.ascontiguousarray(np.array(etats_feux, dtype=np.int64))
+    temps = np.ascontiguousarray(np.array(temps_feux, dtype=np.float64))
+    sortis = np.zeros(pos.shape[0], dtype=np.int8)
+
+    if NUMBA_AVAILABLE:
+        avancer_n_pas_numba(pos, vit, feux, durees, etats, temps, float(longueur), float(dt),
+                            float(marge), int(n_pas), sortis)
+    else:
+        for _ in range(int(n_pas)):
+            for j in range(feux.shape[0]):
+                temps[j] += dt
+                while temps[j] >= durees[j, etats[j]]:
+                    temps[j] -= durees[j, etats[j]]
+                    etats[j] = (etats[j] + 1) % 3
+            bloquants = (etats != 1).astype(np.int8)
+            pos, sortis = avancer_vehicules_np(pos, vit, feux, bloquants, float(longueur), float(dt), float(marge))
+    return pos, sortis, etats, temps
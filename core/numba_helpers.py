@@ -39,3 +39,102 @@ def update_positions_numba(positions, speeds, limits, lengths, densities, variat
                 # ensure a minimum speed of 20
                 speeds[i] = max(20.0, speeds[i] * 0.9)
     return positions, speeds
+
+@njit(cache=True)
+def _avancer_depuis_numba(positions, vitesses_ms, positions_feux, feux_bloquants, longueur, dt, marge,
+                          prochain_feu, sortis):
+    """
+    Core of avancer_vehicules_numba. prochain_feu[i] is a lower bound of the
+    index of the first light strictly ahead of vehicle i; it is moved forward
+    in place, so callers that advance the same vehicles over several steps
+    reuse it instead of searching the lights again (vehicles never move back).
+    """
+    n = positions.shape[0]
+    n_feux = positions_feux.shape[0]
+    for i in range(n):
+        position = positions[i]
+        distance_max = vitesses_ms[i] * dt
+        distance = distance_max
+
+        j = prochain_feu[i]
+        while j < n_feux and positions_feux[j] <= position:
+            j += 1
+        prochain_feu[i] = j
+
+        # first blocking light strictly ahead and within reach
+        while j < n_feux:
+            position_feu = positions_feux[j]
+            if position_feu > position + distance_max:
+                break
+            if feux_bloquants[j] == 1:
+                distance_avant_feu = position_feu - position - marge
+                if distance_avant_feu < distance:
+                    distance = max(0.0, distance_avant_feu)
+                break
+            j += 1
+
+        distance_fin_route = longueur - position
+        if distance_fin_route < distance:
+            distance = max(0.0, distance_fin_route)
+
+        if distance > 0.0:
+            positions[i] = position + distance
+        sortis[i] = 1 if positions[i] >= longueur else 0
+    return positions, sortis
+
+@njit(cache=True)
+def avancer_vehicules_numba(positions, vitesses_ms, positions_feux, feux_bloquants, longueur, dt, marge, sortis):
+    """
+    In-place advance of the vehicles of one route (Numba JIT).
+    positions_feux must be sorted; feux_bloquants is int8 (1 = red/orange light).
+    Each vehicle stops `marge` metres before the first blocking light it would
+    cross, and never past the end of the route. sortis[i] is set to 1 when
+    vehicle i reached the end of the route.
+    """
+    prochain_feu = np.searchsorted(positions_feux, positions, side='right')
+    return _avancer_depuis_numba(positions, vitesses_ms, positions_feux, feux_bloquants,
+                                 longueur, dt, marge, prochain_feu, sortis)
+
+@njit(cache=True)
+def avancer_routes_numba(positions, vitesses_ms, bornes_vehicules, longueurs, marges,
+                         positions_feux, feux_bloquants, bornes_feux, dt, sortis):
+    """
+    In-place advance of the vehicles of several routes in one call (Numba JIT).
+    The vehicles (resp. lights) of route k are the slice
+    bornes_vehicules[k]:bornes_vehicules[k + 1] (resp. bornes_feux) of the
+    concatenated arrays; each slice is advanced with avancer_vehicules_numba.
+    """
+    for k in range(longueurs.shape[0]):
+        a = bornes_vehicules[k]
+        b = bornes_vehicules[k + 1]
+        f = bornes_feux[k]
+        g = bornes_feux[k + 1]
+        avancer_vehicules_numba(positions[a:b], vitesses_ms[a:b], positions_feux[f:g],
+                                feux_bloquants[f:g], longueurs[k], dt, marges[k], sortis[a:b])
+    return positions, sortis
+
+@njit(cache=True)
+def avancer_n_pas_numba(positions, vitesses_ms, positions_feux, durees_feux, etats_feux, temps_feux,
+                        longueur, dt, marge, n_pas, sortis):
+    """
+    In-place advance of one route over n_pas steps of dt (Numba JIT).
+    Lights follow the FeuRouge cycle: etats_feux holds the index of the current
+    state in (rouge, vert, orange), durees_feux[j] the three durations of light j
+    and temps_feux[j] the time spent in the current state. Every step advances
+    the lights first, then the vehicles; each vehicle's next light index is
+    carried over between steps instead of being searched again.
+    """
+    n_feux = positions_feux.shape[0]
+    feux_bloquants = np.zeros(n_feux, dtype=np.int8)
+    # next light of each vehicle, kept from one step to the next
+    prochain_feu = np.searchsorted(positions_feux, positions, side='right')
+    for _ in range(n_pas):
+        for j in range(n_feux):
+            temps_feux[j] += dt
+            while temps_feux[j] >= durees_feux[j, etats_feux[j]]:
+                temps_feux[j] -= durees_feux[j, etats_feux[j]]
+                etats_feux[j] = (etats_feux[j] + 1) % 3
+            feux_bloquants[j] = 0 if etats_feux[j] == 1 else 1
+        _avancer_depuis_numba(positions, vitesses_ms, positions_feux, feux_bloquants,
+                              longueur, dt, marge, prochain_feu, sortis)
+    return positions, sortis
@@ -20,6 +20,9 @@ class FeuRouge:
         temps_ecoule (float): Temps écoulé depuis le dernier changement d'état
         etat_actuel (str): État courant du feu ('rouge', 'vert', 'orange')
         ordre_etats (list): Ordre de transition des états
+            Les routes qui portent le feu sont prévenues à chaque changement
+            d'état, pour tenir à jour leur cache des états de feux.
+        ETAT_SUIVANT (dict): État suivant de chaque état, selon ordre_etats
     
     Example:
         >>> feu = FeuRouge(cycle=5)
@@ -33,6 +36,10 @@ class FeuRouge:
         'vert'
     """
     
+    __slots__ = ('cycle', 'temps_ecoule', 'ordre_etats', '_etat_actuel', '_observateurs')
+    
+    ETAT_SUIVANT = {'rouge': 'vert', 'vert': 'orange', 'orange': 'rouge'}
+    
     def __init__(self, cycle=5):
         """
         Initialise un nouveau feu de circulation.
@@ -48,6 +55,7 @@ class FeuRouge:
             >>> feu1 = FeuRouge(5)  # Cycle standard de 5 secondes par état
             >>> feu2 = FeuRouge({'rouge': 10, 'vert': 8, 'orange': 2})  # Cycle personnalisé
         """
+        self._observateurs = []  # Couples (route, position) qui portent ce feu
         try:
             self.temps_ecoule = 0.0
             self.ordre_etats = ['rouge', 'vert', 'orange']
@@ -83,6 +91,28 @@ class FeuRouge:
             self.temps_ecoule = 0.0
             self.ordre_etats = ['rouge', 'vert', 'orange']
 
+    @classmethod
+    def _unchecked(cls, cycle):
+        """
+        Construit un feu à partir d'un cycle déjà valide, sans validation.
+        
+        Réservé aux appelants qui garantissent un dictionnaire complet
+        aux durées positives (tests, configurations déjà vérifiées).
+        
+        Args:
+            cycle (dict): Configuration du cycle {état: durée}
+        
+        Returns:
+            FeuRouge: Nouveau feu à l'état rouge
+        """
+        feu = cls.__new__(cls)
+        feu._observateurs = []
+        feu.cycle = dict(cycle)
+        feu.ordre_etats = ['rouge', 'vert', 'orange']
+        feu.etat_actuel = 'rouge'
+        feu.temps_ecoule = 0.0
+        return feu
+
     @property
     def etat(self):
         """
@@ -96,7 +126,18 @@ class FeuRouge:
             >>> feu.etat
             'rouge'
         """
-        return self.etat_actuel
+        return self._etat_actuel
+
+    @property
+    def etat_actuel(self):
+        """État courant du feu ('rouge', 'vert', 'orange')."""
+        return self._etat_actuel
+
+    @etat_actuel.setter
+    def etat_actuel(self, etat):
+        self._etat_actuel = etat
+        for route, position in self._observateurs:
+            route._notifier_etat_feu(position, etat)
 
     def avancer_temps(self, dt):
         """
@@ -131,9 +172,7 @@ class FeuRouge:
         Passe à l'état suivant dans le cycle.
         Méthode interne utilisée par avancer_temps.
         """
-        index_actuel = self.ordre_etats.index(self.etat_actuel)
-        index_suivant = (index_actuel + 1) % len(self.ordre_etats)
-        self.etat_actuel = self.ordre_etats[index_suivant]
+        self.etat_actuel = self.ETAT_SUIVANT[self.etat_actuel]
 
     def get_prochain_changement(self):
         """
@@ -165,6 +204,32 @@ class FeuRouge:
         """
         return sum(self.cycle.values())
 
+    def __copy__(self):
+        """
+        Copie le feu sans repasser par la validation du cycle.
+        
+        Le dictionnaire du cycle est dupliqué pour que la copie reste
+        indépendante de l'original ; la copie n'est rattachée à aucune route.
+        
+        Returns:
+            FeuRouge: Nouveau feu dans le même état
+        
+        Example:
+            >>> import copy
+            >>> feu = FeuRouge(5)
+            >>> copie = copy.copy(feu)
+            >>> copie.avancer_temps(5)
+            >>> feu.etat, copie.etat
+            ('rouge', 'vert')
+        """
+        copie = self.__class__.__new__(self.__class__)
+        copie._observateurs = []
+        copie.cycle = self.cycle.copy()
+        copie.ordre_etats = self.ordre_etats
+        copie.etat_actuel = self.etat_actuel
+        copie.temps_ecoule = self.temps_ecoule
+        return copie
+
     def __str__(self):
         """
         Représentation textuelle du feu rouge.
@@ -6,8 +6,10 @@ du réseau routier. Elle gère toutes les routes, les intersections
 et la logique globale de simulation.
 """
 
+import sys
 from typing import Dict, List, Optional
 from exceptions import RouteDejaExistanteError, RouteInexistanteError
+from models.route import mettre_a_jour_routes
 
 class ReseauRoutier:
     """
@@ -89,6 +91,8 @@ class ReseauRoutier:
                 raise RouteInexistanteError(f"La route destination '{route_destination}' n'existe pas")
             
             if route_destination not in self.intersections[route_source]:
+                if isinstance(route_destination, str):
+                    route_destination = sys.intern(route_destination)
                 self.intersections[route_source].append(route_destination)
         except RouteInexistanteError as e:
             print(f"[ERREUR INTERSECTION] {e}")
@@ -162,9 +166,9 @@ class ReseauRoutier:
             'vehicules_sortis': 0
         }
         
-        # Mettre à jour chaque route et collecter les véhicules sortants
-        for nom_route, route in self.routes.items():
-            vehicules_sortis = route.mettre_a_jour_vehicules()
+        # Mettre à jour toutes les routes en un seul appel, puis collecter les véhicules sortants
+        sortis_par_route = mettre_a_jour_routes(self.routes.values())
+        for nom_route, vehicules_sortis in zip(list(self.routes), sortis_par_route):
             stats['vehicules_sortis'] += len(vehicules_sortis)
             
             # Pour chaque véhicule sortant, le déplacer vers une route suivante si possible
@@ -5,6 +5,13 @@ Ce module définit la classe Route qui représente une route
 dans le réseau routier. Une route a une longueur, une limite de vitesse,
 et peut contenir plusieurs véhicules.
 """
+import bisect
+import logging
+import math
+import sys
+
+import numpy as np
+
 from exceptions import (
     LongueurInvalideError,
     LimiteVitesseInvalideError,
@@ -14,6 +21,7 @@ from exceptions import (
     PositionFeuInvalideError
 )
 
+_log = logging.getLogger(__name__)
 
 
 class Route:
@@ -28,7 +36,11 @@ class Route:
         longueur (float): Longueur totale de la route (en mètres)
         limite_vitesse (float): Limite de vitesse autorisée (en km/h)
         vehicules_presents (dict): Véhicules sur la route {id_vehicule: véhicule}
+            Les positions et vitesses des véhicules présents sont stockées dans
+            des tableaux NumPy de la route (une case par véhicule), que les
+            propriétés position et vitesse du Vehicule lisent et écrivent.
         feux_rouges (dict): Feux rouges sur la route {position: FeuRouge}
+        MARGE_SECURITE (float): Distance d'arrêt avant un feu rouge (en mètres)
     
     Example:
         >>> route = Route("Autoroute_A1", 10000, 130)
@@ -38,6 +50,13 @@ class Route:
         1
     """
     
+    __slots__ = ('nom', 'longueur', 'limite_vitesse', 'vehicules_presents', 'feux_rouges',
+                 '_positions_feux', '_feux_tuple', '_etats_feux', '_feux_bloquants',
+                 '_vehicules', '_positions', '_vitesses', '_vitesses_mps')
+    
+    MARGE_SECURITE = 5
+    CAPACITE_INITIALE = 8
+    
     def __init__(self, nom, longueur, limite_vitesse):
         """
         Initialise une nouvelle route.
@@ -56,14 +75,26 @@ class Route:
             if limite_vitesse <= 0:
                 raise LimiteVitesseInvalideError(f"La limite de vitesse doit être positive (valeur: {limite_vitesse})")
                 
-            self.nom = nom
+            # Partagé par les historiques des véhicules
+            self.nom = sys.intern(nom) if isinstance(nom, str) else nom
             self.longueur = longueur
             self.limite_vitesse = limite_vitesse
             self.vehicules_presents = {}  # Dictionnaire {id: vehicule}
             self.feux_rouges = {}  # Dictionnaire {position: FeuRouge}
+            self._positions_feux = []  # Positions des feux, triées par ordre croissant
+            self._feux_tuple = ()  # Couples (position, feu), dans le même ordre
+            # Cache des états, tenu à jour par les feux eux-mêmes (FeuRouge.etat_actuel)
+            self._etats_feux = {}  # Dictionnaire {position: état}
+            self._feux_bloquants = np.zeros(0, dtype=np.int8)  # 1 si rouge/orange, aligné sur _positions_feux
+            
+            # Stockage par colonnes : la case i décrit le véhicule self._vehicules[i]
+            self._vehicules = []
+            self._positions = np.zeros(self.CAPACITE_INITIALE, dtype=np.float64)  # en m
+            self._vitesses = np.zeros(self.CAPACITE_INITIALE, dtype=np.float64)  # en km/h
+            self._vitesses_mps = np.zeros(self.CAPACITE_INITIALE, dtype=np.float64)  # en m/s
         
         except (LongueurInvalideError, LimiteVitesseInvalideError) as e:
-            print(f"[ERREUR INIT ROUTE] {e}")
+            _log.warning("[ERREUR INIT ROUTE] %s", e)
             
     def ajouter_feu_rouge(self, feu, position=None):
         """
@@ -92,13 +123,30 @@ class Route:
             
             # Vérifier s'il y a déjà un feu à cette position
             if position in self.feux_rouges:
-                print(f"[ATTENTION] Remplacement du feu existant à la position {position}")
+                _log.warning("[ATTENTION] Remplacement du feu existant à la position %s", position)
+                self.feux_rouges[position]._observateurs.remove((self, position))
+            else:
+                indice = bisect.bisect_left(self._positions_feux, position)
+                self._positions_feux.insert(indice, position)
+                self._feux_bloquants = np.insert(self._feux_bloquants, indice, 0)
             
             self.feux_rouges[position] = feu
-            print(f"Feu rouge ajouté à la position {position}m sur la route '{self.nom}'")
+            self._feux_tuple = tuple(sorted(self.feux_rouges.items(), key=lambda item: item[0]))
+            feu._observateurs.append((self, position))
+            self._notifier_etat_feu(position, feu.etat)
+            _log.info("Feu rouge ajouté à la position %sm sur la route '%s'", position, self.nom)
             
         except PositionFeuInvalideError as e:
-            print(f"[ERREUR AJOUT FEU] {e}")
+            _log.warning("[ERREUR AJOUT FEU] %s", e)
+
+    def _notifier_etat_feu(self, position, etat):
+        """
+        Met à jour le cache des états après un changement d'état du feu à la position donnée.
+        Méthode interne appelée par FeuRouge.etat_actuel.
+        """
+        self._etats_feux[position] = etat
+        indice = bisect.bisect_left(self._positions_feux, position)
+        self._feux_bloquants[indice] = etat in ['rouge', 'orange']
 
     def _doit_arreter_vehicule(self, vehicule, distance_proposee):
         """
@@ -111,14 +159,23 @@ class Route:
         Returns:
             bool: True si le véhicule doit s'arrêter
         """
-        nouvelle_position = vehicule.position + distance_proposee
+        feux = self._feux_tuple
         
-        # Vérifier chaque feu rouge sur la route
-        for position_feu, feu in self.feux_rouges.items():
-            # Si le véhicule va traverser la position du feu
-            if vehicule.position < position_feu <= nouvelle_position:
-                if feu.etat in ['rouge', 'orange']:
-                    return True
+        # Cas les plus courants : aucun feu ou un seul feu sur la route
+        if not feux:
+            return False
+        nouvelle_position = vehicule.position + distance_proposee
+        if len(feux) == 1:
+            position_feu, feu = feux[0]
+            return (vehicule.position < position_feu <= nouvelle_position
+                    and feu.etat in ['rouge', 'orange'])
+        
+        # Parcourir les feux situés après le véhicule, du plus proche au plus loin
+        i = bisect.bisect_right(self._positions_feux, vehicule.position)
+        while i < len(feux) and feux[i][0] <= nouvelle_position:
+            if feux[i][1].etat in ['rouge', 'orange']:
+                return True
+            i += 1
         return False
 
     def _get_distance_avant_obstacle(self, vehicule, distance_max):
@@ -133,15 +190,20 @@ class Route:
             float: Distance réelle que le véhicule peut parcourir
         """
         distance_possible = distance_max
-        
-        # Vérifier les feux rouges
-        for position_feu, feu in self.feux_rouges.items():
-            if vehicule.position < position_feu <= vehicule.position + distance_max:
-                if feu.etat in ['rouge', 'orange']:
-                    # Le véhicule doit s'arrêter avant le feu
-                    distance_avant_feu = position_feu - vehicule.position - 5  # Marge de sécurité
-                    if distance_avant_feu < distance_possible:
-                        distance_possible = max(0, distance_avant_feu)
+        feux = self._feux_tuple
+        
+        # Vérifier les feux rouges, du plus proche au plus loin : le premier
+        # feu bloquant est aussi celui qui impose l'arrêt le plus tôt
+        i = bisect.bisect_right(self._positions_feux, vehicule.position)
+        while i < len(feux) and feux[i][0] <= vehicule.position + distance_max:
+            position_feu, feu = feux[i]
+            if feu.etat in ['rouge', 'orange']:
+                # Le véhicule doit s'arrêter avant le feu
+                distance_avant_feu = position_feu - vehicule.position - self.MARGE_SECURITE
+                if distance_avant_feu < distance_possible:
+                    distance_possible = max(0, distance_avant_feu)
+                break
+            i += 1
         
         # Vérifier la fin de la route
         distance_fin_route = self.longueur - vehicule.position
@@ -178,34 +240,97 @@ class Route:
                     f"Aucun véhicule présent sur la route '{self.nom}', mise à jour impossible."
                 )
             
-            vehicules_sortis = []
-            vehicules_a_supprimer = []
+            from core.fast_numba import avancer_vehicules
+            n = len(self._vehicules)
             
-            for identifiant, vehicule in self.vehicules_presents.items():
-                # Calculer la distance que le véhicule souhaite parcourir
-                vitesse_ms = vehicule.vitesse * 1000 / 3600  # Conversion km/h -> m/s
-                distance_souhaitee = vitesse_ms * dt
-                
-                # Déterminer la distance réelle en tenant compte des feux
-                distance_reelle = self._get_distance_avant_obstacle(vehicule, distance_souhaitee)
-                
-                # Faire avancer le véhicule
-                if distance_reelle > 0:
-                    vehicule.avancer(distance_reelle)
-                
-                # Vérifier si le véhicule a dépassé la fin de la route
-                if vehicule.position >= self.longueur:
-                    vehicules_sortis.append(vehicule)
-                    vehicules_a_supprimer.append(identifiant)
+            # Avancer tous les véhicules en tenant compte des feux et de la fin de route
+            nouvelles_positions, sortis = avancer_vehicules(
+                self._positions[:n], self._vitesses_mps[:n], self._positions_feux, self._feux_bloquants,
+                self.longueur, dt, self.MARGE_SECURITE
+            )
+            self._positions[:n] = nouvelles_positions
+            
+            # Cas courant : aucun véhicule n'a quitté la route pendant ce pas
+            if not sortis.any():
+                return []
             
             # Supprimer les véhicules qui ont quitté la route
-            for identifiant in vehicules_a_supprimer:
-                self.supprimer_vehicule(identifiant)
+            vehicules_sortis = [self._vehicules[i] for i in np.flatnonzero(sortis)]
+            for vehicule in vehicules_sortis:
+                self.supprimer_vehicule(vehicule.identifiant)
             
             return vehicules_sortis
             
         except AucuneMiseAJourPossibleError as e:
-            print(f"[ERREUR MISE À JOUR] {e}")
+            _log.warning("[ERREUR MISE À JOUR] %s", e)
+            return []
+
+    def avancer(self, duree, dt=1.0):
+        """
+        Fait avancer la route pendant une durée, par pas de dt, en un seul appel.
+        
+        La durée doit être un nombre entier de pas (à l'arrondi flottant près,
+        par exemple 0.3 s avec dt=0.1). Équivaut à appeler
+        mettre_a_jour_vehicules(dt) round(duree / dt) fois, feux compris, mais
+        la boucle sur les pas est exécutée dans le noyau de calcul au lieu
+        d'une boucle Python. Si un même feu est placé à plusieurs positions de
+        la route, ce sont ces appels pas à pas qui sont effectués.
+        
+        Args:
+            duree (float): Durée totale à simuler en secondes, multiple de dt
+            dt (float): Intervalle de temps en secondes de chaque pas
+        
+        Returns:
+            list: Liste des véhicules qui ont quitté la route pendant la durée
+        
+        Example:
+            >>> vehicules_sortis = route.avancer(15.0, dt=1.0)
+        """
+        try:
+            if dt <= 0 or duree < 0:
+                raise ValueError(f"Durée ou pas de temps invalide: duree={duree}, dt={dt}")
+            
+            n_pas = round(duree / dt)
+            if not math.isclose(n_pas * dt, duree, rel_tol=1e-9, abs_tol=1e-12):
+                raise ValueError(f"La durée {duree} n'est pas un nombre entier de pas de {dt}")
+            
+            feux = [feu for _, feu in self._feux_tuple]
+            if len({id(feu) for feu in feux}) < len(feux):
+                # Un feu placé à plusieurs positions avance une fois par position
+                # à chaque pas : le noyau, qui suit un état par position, ne
+                # reproduit pas ce partage, d'où la boucle pas à pas
+                vehicules_sortis = []
+                for _ in range(n_pas):
+                    vehicules_sortis += self.mettre_a_jour_vehicules(dt)
+                return vehicules_sortis
+            
+            from core.fast_numba import avancer_n_pas
+            n = len(self._vehicules)
+            ordre = ['rouge', 'vert', 'orange']
+            
+            nouvelles_positions, sortis, etats, temps = avancer_n_pas(
+                self._positions[:n], self._vitesses_mps[:n], self._positions_feux,
+                [[feu.cycle[etat] for etat in ordre] for feu in feux],
+                [ordre.index(feu.etat_actuel) for feu in feux],
+                [feu.temps_ecoule for feu in feux],
+                self.longueur, dt, n_pas, self.MARGE_SECURITE
+            )
+            self._positions[:n] = nouvelles_positions
+            
+            # Reporter l'état final des feux (le setter met à jour le cache de la route)
+            for j, feu in enumerate(feux):
+                feu.temps_ecoule = float(temps[j])
+                if feu.etat_actuel != ordre[etats[j]]:
+                    feu.etat_actuel = ordre[etats[j]]
+            
+            vehicules_sortis = [self._vehicules[i] for i in np.flatnonzero(sortis)]
+            for vehicule in vehicules_sortis:
+                self.supprimer_vehicule(vehicule.identifiant)
+            
+            return vehicules_sortis
+        
+        except ValueError as e:
+            _log.warning("[ERREUR AVANCER ROUTE] %s", e)
             return []
 
     def ajouter_vehicule(self, vehicule):
@@ -214,6 +339,9 @@ class Route:
         
         Le véhicule est ajouté à la liste des véhicules présents sur la route.
         Vérifie que le véhicule n'est pas déjà présent et que sa position est valide.
+        Un véhicule n'est présent que sur une route à la fois : s'il était sur
+        une autre route, il en est d'abord retiré. Sa position et sa vitesse
+        sont ensuite lues comme des float.
         
         Args:
             vehicule (Vehicule): Véhicule à ajouter à la route
@@ -237,11 +365,25 @@ class Route:
                     f"Position {vehicule.position} dépasse la longueur maximale de la route ({self.longueur})"
                 )
     
+            # Un véhicule n'est stocké que sur une seule route à la fois
+            if vehicule._route is not None:
+                vehicule._route.supprimer_vehicule(vehicule.identifiant)
+            
+            indice = len(self._vehicules)
+            if indice == len(self._positions):
+                self._agrandir_stockage()
+            self._positions[indice] = vehicule.position
+            self._vitesses[indice] = vehicule.vitesse
+            self._vitesses_mps[indice] = vehicule._vitesse_mps
+            self._vehicules.append(vehicule)
+            vehicule._route = self
+            vehicule._indice = indice
+            
             self.vehicules_presents[vehicule.identifiant] = vehicule
             vehicule.route_actuelle = self.nom
     
         except (VehiculeDejaPresentError, PositionVehiculeInvalideError) as e:
-            print(f"[ERREUR AJOUT VEHICULE] {e}")
+            _log.warning("[ERREUR AJOUT VEHICULE] %s", e)
             
 
     def supprimer_vehicule(self, identifiant_vehicule):
@@ -258,7 +400,38 @@ class Route:
             >>> route.supprimer_vehicule(1)
             <Vehicule object at 0x...>
         """
-        return self.vehicules_presents.pop(identifiant_vehicule, None)
+        vehicule = self.vehicules_presents.pop(identifiant_vehicule, None)
+        if vehicule is None:
+            return None
+        
+        # Rendre au véhicule ses propres valeurs avant de libérer sa case
+        indice = vehicule._indice
+        vehicule._position = float(self._positions[indice])
+        vehicule._vitesse = float(self._vitesses[indice])
+        vehicule._vitesse_mps = float(self._vitesses_mps[indice])
+        vehicule._route = None
+        vehicule._indice = None
+        
+        # Déplacer le dernier véhicule dans la case libérée (suppression en O(1))
+        dernier = self._vehicules.pop()
+        if dernier is not vehicule:
+            self._vehicules[indice] = dernier
+            self._positions[indice] = self._positions[len(self._vehicules)]
+            self._vitesses[indice] = self._vitesses[len(self._vehicules)]
+            self._vitesses_mps[indice] = self._vitesses_mps[len(self._vehicules)]
+            dernier._indice = indice
+        
+        return vehicule
+    
+    def _agrandir_stockage(self):
+        """
+        Double la capacité des tableaux de positions et de vitesses.
+        Méthode interne utilisée par ajouter_vehicule.
+        """
+        capacite = 2 * len(self._positions)
+        self._positions = np.resize(self._positions, capacite)
+        self._vitesses = np.resize(self._vitesses, capacite)
+        self._vitesses_mps = np.resize(self._vitesses_mps, capacite)
     
     def get_nombre_vehicules(self):
         """
@@ -315,7 +488,7 @@ class Route:
             >>> route.get_etat_feux()
             {500: 'rouge', 800: 'vert'}
         """
-        return {position: feu.etat for position, feu in self.feux_rouges.items()}
+        return self._etats_feux.copy()
     
     def __str__(self):
         """
@@ -334,4 +507,61 @@ class Route:
         Returns:
             str: Représentation pouvant être utilisée pour recréer l'objet
         """
-        return f"Route(nom='{self.nom}', longueur={self.longueur}, limite_vitesse={self.limite_vitesse})"
\ No newline at end of file
+        return f"Route(nom='{self.nom}', longueur={self.longueur}, limite_vitesse={self.limite_vitesse})"
+
+def mettre_a_jour_routes(routes, dt=1.0):
+    """
+    Met à jour les véhicules de plusieurs routes en un seul appel de calcul.
+    
+    Équivaut à appeler mettre_a_jour_vehicules sur chaque route, mais les
+    positions de toutes les routes sont avancées ensemble, sans passer par
+    une boucle Python par route. Les routes vides ne sont pas signalées.
+    
+    Args:
+        routes (iterable): Routes à mettre à jour
+        dt (float): Pas de temps en secondes
+    
+    Returns:
+        list: Pour chaque route, dans l'ordre, la liste des véhicules sortis
+    
+    Example:
+        >>> sortis = mettre_a_jour_routes(reseau.routes.values(), dt=1.0)
+    """
+    from core.fast_numba import avancer_routes
+    routes = list(routes)
+    
+    bornes_vehicules = [0]
+    bornes_feux = [0]
+    for route in routes:
+        for feu in route.feux_rouges.values():
+            feu.avancer_temps(dt)
+        bornes_vehicules.append(bornes_vehicules[-1] + len(route._vehicules))
+        bornes_feux.append(bornes_feux[-1] + len(route._positions_feux))
+    
+    if bornes_vehicules[-1] == 0:
+        return [[] for _ in routes]
+    
+    nouvelles_positions, sortis = avancer_routes(
+        np.concatenate([route._positions[:len(route._vehicules)] for route in routes]),
+        np.concatenate([route._vitesses_mps[:len(route._vehicules)] for route in routes]),
+        bornes_vehicules,
+        [route.longueur for route in routes],
+        [route.MARGE_SECURITE for route in routes],
+        [p for route in routes for p in route._positions_feux],
+        np.concatenate([route._feux_bloquants for route in routes]),
+        bornes_feux,
+        dt
+    )
+    
+    resultats = []
+    for k, route in enumerate(routes):
+        debut, fin = bornes_vehicules[k], bornes_vehicules[k + 1]
+        route._positions[:fin - debut] = nouvelles_positions[debut:fin]
+        
+        # Les indices sont relevés avant toute suppression, qui déplace les cases
+        vehicules_sortis = [route._vehicules[i] for i in np.flatnonzero(sortis[debut:fin])]
+        for vehicule in vehicules_sortis:
+            route.supprimer_vehicule(vehicule.identifiant)
+        resultats.append(vehicules_sortis)
+    
+    return resultats
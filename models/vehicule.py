@@ -6,6 +6,9 @@ dans la simulation de trafic routier. Chaque véhicule a une position,
 une vitesse, et peut se déplacer sur différentes routes.
 """
 
+import sys
+from collections import deque
+
 from exceptions import (
     PositionInvalideError,
     VitesseInvalideError,
@@ -15,13 +18,29 @@ from exceptions import (
 class Vehicule:
     """
     Représente un véhicule dans le simulateur de trafic.
+
+    Seules les TAILLE_HISTORIQUE dernières routes sont conservées dans
+    historique_routes, pour borner la mémoire sur les longues simulations.
+
+    Tant que le véhicule est sur une Route, sa position et sa vitesse sont
+    stockées dans les tableaux de cette route (voir Route.ajouter_vehicule) ;
+    les propriétés position et vitesse y lisent et écrivent directement, et
+    renvoient alors des float.
     """
 
+    __slots__ = ('identifiant', 'route_actuelle', 'historique_routes',
+                 '_position', '_vitesse', '_vitesse_mps', '_route', '_indice')
+
+    TAILLE_HISTORIQUE = 32
+
     def __init__(self, identifiant, route_actuelle, position=0, vitesse=0):
         """
         Initialise un nouveau véhicule.
         Gère les erreurs d’entrée sans provoquer l’arrêt du programme.
         """
+        # Aucune route ne stocke encore la position et la vitesse
+        self._route = None
+        self._indice = None
         try:
             if identifiant < 0:
                 raise ValueError("L'identifiant doit être un nombre positif.")
@@ -34,7 +53,7 @@ class Vehicule:
             self.route_actuelle = route_actuelle
             self.position = position
             self.vitesse = vitesse
-            self.historique_routes = [route_actuelle]
+            self.historique_routes = deque([route_actuelle], maxlen=self.TAILLE_HISTORIQUE)
 
         except (ValueError, PositionInvalideError, VitesseInvalideError) as e:
             # On signale l’erreur mais on empêche l’arrêt brutal
@@ -44,7 +63,38 @@ class Vehicule:
             self.route_actuelle = route_actuelle or "Route_Inconnue"
             self.position = max(0, position)
             self.vitesse = max(0, vitesse)
-            self.historique_routes = [self.route_actuelle]
+            self.historique_routes = deque([self.route_actuelle], maxlen=self.TAILLE_HISTORIQUE)
+
+    @property
+    def position(self):
+        """Position sur la route actuelle (en mètres)."""
+        if self._route is None:
+            return self._position
+        return float(self._route._positions[self._indice])
+
+    @position.setter
+    def position(self, valeur):
+        if self._route is None:
+            self._position = valeur
+        else:
+            self._route._positions[self._indice] = valeur
+
+    @property
+    def vitesse(self):
+        """Vitesse du véhicule (en km/h)."""
+        if self._route is None:
+            return self._vitesse
+        return float(self._route._vitesses[self._indice])
+
+    @vitesse.setter
+    def vitesse(self, valeur):
+        # La conversion en m/s est faite ici une fois, pas à chaque pas de simulation
+        if self._route is None:
+            self._vitesse = valeur
+            self._vitesse_mps = valeur * 1000 / 3600
+        else:
+            self._route._vitesses[self._indice] = valeur
+            self._route._vitesses_mps[self._indice] = valeur * 1000 / 3600
 
     def avancer(self, distance):
         """
@@ -76,6 +126,8 @@ class Vehicule:
             if nouvelle_position < 0:
                 raise PositionInvalideError("La position sur la nouvelle route ne peut pas être négative.")
 
+            if isinstance(nouvelle_route, str):
+                nouvelle_route = sys.intern(nouvelle_route)
             self.route_actuelle = nouvelle_route
             self.position = nouvelle_position
             self.historique_routes.append(nouvelle_route)
@@ -83,15 +135,26 @@ class Vehicule:
         except (ValueError, PositionInvalideError) as e:
             print(f"[Erreur] Changement de route impossible pour le véhicule {self.identifiant} : {e}")
 
+    # Les valeurs entières sont affichées sans ".0", que le véhicule soit sur
+    # une route (valeurs lues dans ses tableaux float64) ou non
     def __str__(self):
         return (
             f"Véhicule {self.identifiant} sur {self.route_actuelle} "
-            f"à position {self.position}m, vitesse {self.vitesse}km/h"
+            f"à position {_afficher_nombre(self.position)}m, "
+            f"vitesse {_afficher_nombre(self.vitesse)}km/h"
         )
 
     def __repr__(self):
         return (
             f"Vehicule(identifiant={self.identifiant}, "
             f"route_actuelle='{self.route_actuelle}', "
-            f"position={self.position}, vitesse={self.vitesse})"
+            f"position={_afficher_nombre(self.position)}, "
+            f"vitesse={_afficher_nombre(self.vitesse)})"
         )
+
+
+def _afficher_nombre(valeur):
+    """Retourne valeur sous forme d'entier si c'est un flottant entier (100.0 -> 100)."""
+    if isinstance(valeur, float) and valeur.is_integer():
+        return int(valeur)
+    return valeur
@@ -9,37 +9,70 @@ import os
 import pytest
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
-from models.vehicule import Vehicule
-from models.route import Route
-from models.reseau import ReseauRoutier
+
+# Doublon unittest de test_feurouge_pytest.py : exécuté uniquement par
+# `python -m unittest`, pour ne pas jouer chaque scénario deux fois sous pytest.
+collect_ignore = ["test_feurouge_unittest.py"]
 
 @pytest.fixture
 def route_simple():
     """Crée une route simple pour les tests."""
+    from models.route import Route
     return Route("A1", longueur=1000, limite_vitesse=50)
 
 
 @pytest.fixture
 def route_longue():
     """Crée une route longue pour les tests."""
+    from models.route import Route
     return Route("Autoroute_A2", longueur=5000, limite_vitesse=130)
 
 
+@pytest.fixture
+def make_vehicule():
+    """Fabrique de véhicules : make_vehicule(position=400) -> Vehicule(1, "Route_A", 400, 50)."""
+    from models.vehicule import Vehicule
+    
+    def _fabriquer(identifiant=1, route_actuelle="Route_A", position=0, vitesse=50):
+        return Vehicule(identifiant, route_actuelle, position=position, vitesse=vitesse)
+    return _fabriquer
+
+
+@pytest.fixture
+def make_route():
+    """Fabrique de routes : make_route() -> Route("Route_A", 1000, 90)."""
+    from models.route import Route
+    
+    def _fabriquer(nom="Route_A", longueur=1000, limite_vitesse=90):
+        return Route(nom, longueur, limite_vitesse)
+    return _fabriquer
+
+
+@pytest.fixture(scope="session")
+def _feu_template():
+    """Feu standard (cycle=5) construit une seule fois, à copier par les tests."""
+    from models.feuRouge import FeuRouge
+    return FeuRouge(cycle=5)
+
+
 @pytest.fixture
 def vehicule_exemple(route_simple):
     """Crée un véhicule exemple sur une route simple."""
+    from models.vehicule import Vehicule
     return Vehicule(identifiant=1, route_actuelle=route_simple.nom, position=0, vitesse=30)
 
 
 @pytest.fixture
 def vehicule_avance(route_simple):
     """Crée un véhicule avancé sur une route."""
+    from models.vehicule import Vehicule
     return Vehicule(identifiant=2, route_actuelle=route_simple.nom, position=500, vitesse=40)
 
 
 @pytest.fixture
 def reseau_simple(route_simple, vehicule_exemple):
     """Crée un réseau simple avec une route et un véhicule."""
+    from models.reseau import ReseauRoutier
     reseau = ReseauRoutier()
     reseau.ajouter_route(route_simple)
     route_simple.ajouter_vehicule(vehicule_exemple)
@@ -49,6 +82,7 @@ def reseau_simple(route_simple, vehicule_exemple):
 @pytest.fixture
 def reseau_complexe(route_simple, route_longue, vehicule_exemple, vehicule_avance):
     """Crée un réseau complexe avec plusieurs routes et véhicules."""
+    from models.reseau import ReseauRoutier
     reseau = ReseauRoutier()
     
     # Ajouter les routes
@@ -69,11 +103,17 @@ def reseau_complexe(route_simple, route_longue, vehicule_exemple, vehicule_avanc
 @pytest.fixture
 def vehicule_pres_fin_route(route_simple):
     """Crée un véhicule près de la fin d'une route."""
+    from models.vehicule import Vehicule
     return Vehicule(identifiant=3, route_actuelle=route_simple.nom, position=950, vitesse=30)
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def config_file_simple():
-    """Crée un fichier de configuration simple pour les tests."""
+    """
+    Crée un fichier de configuration simple pour les tests.
+
+    Le fichier est en lecture seule pour les tests : il est donc écrit
+    une seule fois par session et supprimé à la fin.
+    """
     import tempfile
     import json
     import os
@@ -120,7 +160,7 @@ def config_file_simple():
     
     yield temp_config_file
     
-    # Nettoyer après le test
+    # Nettoyer à la fin de la session
     if os.path.exists(temp_config_file):
         os.unlink(temp_config_file)
 
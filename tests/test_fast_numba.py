@@ -0,0 +1,98 @@
+"""
+Tests d'équivalence entre les noyaux Numba et leurs équivalents NumPy
+
+Les wrappers de core.fast_numba choisissent l'implémentation selon
+NUMBA_AVAILABLE : chaque test force successivement les deux valeurs et
+vérifie que les résultats sont identiques.
+"""
+
+import numpy as np
+import pytest
+
+from core import fast_numba
+
+
+pytestmark = pytest.mark.skipif(
+    not fast_numba.NUMBA_AVAILABLE, reason="Numba n'est pas installé (extra 'numba')"
+)
+
+
+def _executer_les_deux(monkeypatch, fonction, *args):
+    """Retourne les résultats de fonction(*args) avec puis sans Numba."""
+    resultats = []
+    for disponible in (True, False):
+        monkeypatch.setattr(fast_numba, "NUMBA_AVAILABLE", disponible)
+        resultats.append(fonction(*args))
+    return resultats
+
+
+def _route_aleatoire(rng, n_vehicules, n_feux, longueur):
+    """Tire des véhicules et des feux sur une route, dont des véhicules placés pile sur un feu."""
+    positions_feux = np.sort(rng.choice(np.arange(1, longueur), size=n_feux, replace=False)).astype(np.float64)
+    positions = rng.uniform(0, longueur, size=n_vehicules)
+    positions[:n_feux // 2] = positions_feux[:n_feux // 2]
+    vitesses_ms = rng.uniform(0, 40, size=n_vehicules)
+    vitesses_ms[::7] = 0.0
+    return positions, vitesses_ms, positions_feux
+
+
+class TestEquivalenceNumbaNumPy:
+    """
+    Tests que les noyaux Numba et les équivalents NumPy donnent les mêmes résultats
+    """
+
+    @pytest.mark.parametrize("graine", [0, 1, 2])
+    def test_avancer_vehicules(self, monkeypatch, graine):
+        """Test avancer_vehicules sur des routes tirées au hasard."""
+        rng = np.random.default_rng(graine)
+        positions, vitesses_ms, positions_feux = _route_aleatoire(rng, 60, 8, 500)
+        feux_bloquants = rng.integers(0, 2, size=8).astype(np.int8)
+
+        avec_numba, sans_numba = _executer_les_deux(
+            monkeypatch, fast_numba.avancer_vehicules,
+            positions, vitesses_ms, positions_feux, feux_bloquants, 500.0, 1.0, 5.0
+        )
+
+        for attendu, obtenu in zip(avec_numba, sans_numba):
+            np.testing.assert_array_equal(obtenu, attendu)
+
+    @pytest.mark.parametrize("graine", [0, 1, 2])
+    def test_avancer_routes(self, monkeypatch, graine):
+        """Test avancer_routes sur plusieurs routes concaténées, dont une sans feu."""
+        rng = np.random.default_rng(graine)
+        longueurs = [500.0, 1200.0, 300.0]
+        n_feux = [4, 0, 2]
+        routes = [_route_aleatoire(rng, 30, f, int(l)) for l, f in zip(longueurs, n_feux)]
+        positions = np.concatenate([r[0] for r in routes])
+        vitesses_ms = np.concatenate([r[1] for r in routes])
+        positions_feux = np.concatenate([r[2] for r in routes])
+        feux_bloquants = rng.integers(0, 2, size=positions_feux.shape[0]).astype(np.int8)
+        bornes_vehicules = [0, 30, 60, 90]
+        bornes_feux = np.concatenate([[0], np.cumsum(n_feux)])
+
+        avec_numba, sans_numba = _executer_les_deux(
+            monkeypatch, fast_numba.avancer_routes,
+            positions, vitesses_ms, bornes_vehicules, longueurs, [5.0, 5.0, 5.0],
+            positions_feux, feux_bloquants, bornes_feux, 1.0
+        )
+
+        for attendu, obtenu in zip(avec_numba, sans_numba):
+            np.testing.assert_array_equal(obtenu, attendu)
+
+    @pytest.mark.parametrize("dt, n_pas", [(1.0, 20), (0.1, 50)], ids=["dt_1", "dt_0.1"])
+    def test_avancer_n_pas(self, monkeypatch, dt, n_pas):
+        """Test avancer_n_pas, feux compris, sur plusieurs pas."""
+        rng = np.random.default_rng(0)
+        positions, vitesses_ms, positions_feux = _route_aleatoire(rng, 40, 5, 800)
+        durees_feux = rng.choice([1.0, 2.5, 5.0], size=(5, 3))
+        etats_feux = rng.integers(0, 3, size=5)
+        temps_feux = rng.uniform(0, 1, size=5)
+
+        avec_numba, sans_numba = _executer_les_deux(
+            monkeypatch, fast_numba.avancer_n_pas,
+            positions, vitesses_ms, positions_feux, durees_feux, etats_feux, temps_feux,
+            800.0, dt, n_pas, 5.0
+        )
+
+        for attendu, obtenu in zip(avec_numba, sans_numba):
+            np.testing.assert_array_equal(obtenu, attendu)
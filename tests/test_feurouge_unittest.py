@@ -2,11 +2,12 @@
 Tests unitaires pour la classe FeuRouge - Version unittest
 """
 
+import contextlib
+import copy
+import io
 import unittest
 import sys
 import os
-from unittest.mock import patch
-from io import StringIO
 
 from models.feuRouge import FeuRouge
 
@@ -16,10 +17,16 @@ class TestFeuRougeUnittest(unittest.TestCase):
     Tests unitaires pour la classe FeuRouge utilisant le framework unittest
     """
     
+    @classmethod
+    def setUpClass(cls):
+        """Construit une seule fois les feux servant de modèles"""
+        cls._TEMPLATE = FeuRouge(cycle=5)
+        cls._TEMPLATE_PERSONNALISE = FeuRouge(cycle={'rouge': 10, 'vert': 8, 'orange': 2})
+    
     def setUp(self):
         """Initialisation avant chaque test"""
-        self.feu_standard = FeuRouge(cycle=5)
-        self.feu_personnalise = FeuRouge(cycle={'rouge': 10, 'vert': 8, 'orange': 2})
+        self.feu_standard = copy.copy(self._TEMPLATE)
+        self.feu_personnalise = copy.copy(self._TEMPLATE_PERSONNALISE)
     
     def test_initialisation_standard(self):
         """Test de l'initialisation avec un cycle standard"""
@@ -36,35 +43,24 @@ class TestFeuRougeUnittest(unittest.TestCase):
         self.assertEqual(self.feu_personnalise.cycle['vert'], 8)
         self.assertEqual(self.feu_personnalise.cycle['orange'], 2)
     
-    def test_initialisation_cycle_invalide_negatif(self):
-        """Test de l'initialisation avec un cycle négatif"""
-        # Capture la sortie print
-        with patch('sys.stdout', new_callable=StringIO) as mock_stdout:
-            feu = FeuRouge(cycle=-5)
-        
-        # Vérifie que l'objet est créé avec des valeurs par défaut
-        self.assertEqual(feu.etat, 'rouge')
-        # Vérifie qu'un message d'erreur a été imprimé
-        output = mock_stdout.getvalue()
-        self.assertIn("ERREUR", output)
-    
-    def test_initialisation_cycle_zero(self):
-        """Test de l'initialisation avec un cycle à zéro"""
-        with patch('sys.stdout', new_callable=StringIO) as mock_stdout:
-            feu = FeuRouge(cycle=0)
-        
-        self.assertEqual(feu.etat, 'rouge')
-        output = mock_stdout.getvalue()
-        self.assertIn("ERREUR", output)
-    
-    def test_initialisation_dict_incomplet(self):
-        """Test de l'initialisation avec un dictionnaire incomplet"""
-        with patch('sys.stdout', new_callable=StringIO) as mock_stdout:
-            feu = FeuRouge(cycle={'rouge': 5, 'vert': 5})  # Manque 'orange'
-        
-        self.assertEqual(feu.etat, 'rouge')
-        output = mock_stdout.getvalue()
-        self.assertIn("ERREUR", output)
+    def test_initialisation_invalide(self):
+        """Test de l'initialisation avec un cycle invalide"""
+        cycles_invalides = [
+            -5,
+            0,
+            {'rouge': 5, 'vert': 5},  # Manque 'orange'
+        ]
+        for cycle in cycles_invalides:
+            with self.subTest(cycle=cycle):
+                # Capture la sortie print
+                buf = io.StringIO()
+                with contextlib.redirect_stdout(buf):
+                    feu = FeuRouge(cycle=cycle)
+                
+                # Vérifie que l'objet est créé avec des valeurs par défaut
+                self.assertEqual(feu.etat, 'rouge')
+                # Vérifie qu'un message d'erreur a été imprimé
+                self.assertIn("ERREUR", buf.getvalue())
     
     def test_propriete_etat(self):
         """Test de la propriété etat en lecture seule"""
@@ -78,12 +74,12 @@ class TestFeuRougeUnittest(unittest.TestCase):
         # Avancer de 3 secondes - doit rester rouge
         self.feu_standard.avancer_temps(3)
         self.assertEqual(self.feu_standard.etat, 'rouge')
-        self.assertAlmostEqual(self.feu_standard.temps_ecoule, 3.0)
+        self.assertEqual(self.feu_standard.temps_ecoule, 3.0)
         
         # Avancer de 3 secondes supplémentaires - doit passer à vert
         self.feu_standard.avancer_temps(3)
         self.assertEqual(self.feu_standard.etat, 'vert')
-        self.assertAlmostEqual(self.feu_standard.temps_ecoule, 1.0)  # 3+3-5=1
+        self.assertEqual(self.feu_standard.temps_ecoule, 1.0)  # 3+3-5=1
     
     def test_avancer_temps_personnalise(self):
         """Test de avancer_temps avec cycle personnalisé"""
@@ -113,12 +109,13 @@ class TestFeuRougeUnittest(unittest.TestCase):
     
     def test_avancer_temps_negatif(self):
         """Test de avancer_temps avec temps négatif"""
-        with patch('sys.stdout', new_callable=StringIO) as mock_stdout:
+        buf = io.StringIO()
+        with contextlib.redirect_stdout(buf):
             self.feu_standard.avancer_temps(-1)
         
         # L'état ne doit pas changer
         self.assertEqual(self.feu_standard.etat, 'rouge')
-        output = mock_stdout.getvalue()
+        output = buf.getvalue()
         self.assertIn("ERREUR", output)
     
     def test_avancer_temps_zero(self):
@@ -154,9 +151,10 @@ class TestFeuRougeUnittest(unittest.TestCase):
     
     def test_repr(self):
         """Test de la représentation technique"""
-        feu = FeuRouge(cycle=5)
-        expected_repr = "FeuRouge(cycle={'rouge': 5, 'vert': 5, 'orange': 5})"
-        self.assertEqual(repr(feu), expected_repr)
+        representation = repr(self.feu_standard)
+        self.assertTrue(representation.startswith("FeuRouge(cycle="))
+        for etat in ('rouge', 'vert', 'orange'):
+            self.assertIn(f"'{etat}': 5", representation)
     
     def test_str(self):
         """Test de la représentation textuelle"""
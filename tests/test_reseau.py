@@ -69,6 +69,19 @@ class TestReseauRoutier:
         assert "Autoroute_A2" in reseau.intersections["A1"]
         assert len(reseau.intersections["A1"]) == 1  # Pas de doublon
     
+    def test_ajouter_intersection_noms_non_chaines(self):
+        """Test l'ajout d'une intersection entre routes dont les noms ne sont pas des chaînes."""
+        # Arrange
+        reseau = ReseauRoutier()
+        reseau.ajouter_route(Route(1, 100, 50))
+        reseau.ajouter_route(Route(2, 100, 50))
+        
+        # Act
+        reseau.ajouter_intersection(1, 2)
+        
+        # Assert
+        assert reseau.intersections[1] == [2]
+    
     def test_get_route_existante(self, reseau_simple):
         """Test la récupération d'une route existante."""
         # Arrange
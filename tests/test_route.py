@@ -2,14 +2,13 @@
 Tests complets pour la classe Route - Amélioration de la couverture
 """
 
+import logging
 import pytest
 import sys
 import os
-from unittest.mock import patch
-from io import StringIO
 
 
-from models.route import Route
+from models.route import Route, mettre_a_jour_routes
 from models.vehicule import Vehicule
 from models.feuRouge import FeuRouge
 from exceptions import (
@@ -27,122 +26,140 @@ class TestRouteComplet:
     Tests complets pour améliorer la couverture de la classe Route
     """
     
-    def test_creation_route_longueur_invalide(self):
+    def test_creation_route_longueur_invalide(self, caplog):
         """Test la création d'une route avec longueur invalide (gestion d'erreur)."""
-        with patch('sys.stdout', new_callable=StringIO) as mock_stdout:
-            route = Route("Route_Invalide", longueur=0, limite_vitesse=90)
+        route = Route("Route_Invalide", longueur=0, limite_vitesse=90)
         
         # Vérifie que l'erreur est gérée
-        output = mock_stdout.getvalue()
+        output = caplog.text
         assert "[ERREUR INIT ROUTE]" in output
         assert "longueur" in output.lower()
     
-    def test_creation_route_longueur_negative(self):
+    def test_creation_route_longueur_negative(self, caplog):
         """Test la création d'une route avec longueur négative (gestion d'erreur)."""
-        with patch('sys.stdout', new_callable=StringIO) as mock_stdout:
-            route = Route("Route_Negative", longueur=-100, limite_vitesse=90)
+        route = Route("Route_Negative", longueur=-100, limite_vitesse=90)
         
-        output = mock_stdout.getvalue()
+        output = caplog.text
         assert "[ERREUR INIT ROUTE]" in output
     
-    def test_creation_route_limite_vitesse_invalide(self):
+    def test_creation_route_limite_vitesse_invalide(self, caplog):
         """Test la création d'une route avec limite de vitesse invalide (gestion d'erreur)."""
-        with patch('sys.stdout', new_callable=StringIO) as mock_stdout:
-            route = Route("Route_Vitesse_Invalide", longueur=1000, limite_vitesse=0)
+        route = Route("Route_Vitesse_Invalide", longueur=1000, limite_vitesse=0)
         
-        output = mock_stdout.getvalue()
+        output = caplog.text
         assert "[ERREUR INIT ROUTE]" in output
         assert "limite de vitesse" in output.lower()
     
-    def test_creation_route_limite_vitesse_negative(self):
+    def test_creation_route_limite_vitesse_negative(self, caplog):
         """Test la création d'une route avec limite de vitesse négative (gestion d'erreur)."""
-        with patch('sys.stdout', new_callable=StringIO) as mock_stdout:
-            route = Route("Route_Vitesse_Negative", longueur=1000, limite_vitesse=-50)
+        route = Route("Route_Vitesse_Negative", longueur=1000, limite_vitesse=-50)
         
-        output = mock_stdout.getvalue()
+        output = caplog.text
         assert "[ERREUR INIT ROUTE]" in output
     
-    def test_ajouter_vehicule_deja_present(self):
+    def test_creation_route_nom_non_chaine(self):
+        """Test qu'un nom de route qui n'est pas une chaîne est conservé tel quel."""
+        route = Route(1, longueur=100, limite_vitesse=50)
+        
+        assert route.nom == 1
+        assert route.longueur == 100
+    
+    def test_ajouter_vehicule_deja_present(self, caplog, make_route, make_vehicule):
         """Test l'ajout d'un véhicule déjà présent sur la route (gestion d'erreur)."""
-        route = Route("Route_A", 1000, 90)
-        vehicule = Vehicule(1, "Route_A", position=0, vitesse=50)
+        route = make_route()
+        vehicule = make_vehicule()
         
         # Premier ajout - devrait fonctionner
         route.ajouter_vehicule(vehicule)
         
         # Deuxième ajout - devrait échouer
-        with patch('sys.stdout', new_callable=StringIO) as mock_stdout:
-            route.ajouter_vehicule(vehicule)
+        route.ajouter_vehicule(vehicule)
         
-        output = mock_stdout.getvalue()
+        output = caplog.text
         assert "[ERREUR AJOUT VEHICULE]" in output
         assert "déjà sur la route" in output
     
-    def test_ajouter_vehicule_position_invalide(self):
+    def test_ajouter_vehicule_position_invalide(self, caplog, make_route, make_vehicule):
         """Test l'ajout d'un véhicule avec position invalide (gestion d'erreur)."""
-        route = Route("Route_A", 1000, 90)
+        route = make_route()
         # Véhicule avec position au-delà de la longueur de la route
-        vehicule = Vehicule(1, "Route_A", position=1500, vitesse=50)
+        vehicule = make_vehicule(position=1500)
         
-        with patch('sys.stdout', new_callable=StringIO) as mock_stdout:
-            route.ajouter_vehicule(vehicule)
+        route.ajouter_vehicule(vehicule)
         
-        output = mock_stdout.getvalue()
+        output = caplog.text
         assert "[ERREUR AJOUT VEHICULE]" in output
         assert "dépasse la longueur" in output
     
-    def test_mettre_a_jour_vehicules_route_vide(self):
+    def test_ajouter_vehicule_deja_sur_une_autre_route(self, make_route, make_vehicule):
+        """Test qu'un véhicule ajouté à une route est retiré de sa route précédente."""
+        route_a = make_route()
+        route_b = make_route(nom="Route_B")
+        vehicule = make_vehicule(position=100, vitesse=50)
+        route_a.ajouter_vehicule(vehicule)
+        
+        route_b.ajouter_vehicule(vehicule)
+        
+        assert route_a.get_nombre_vehicules() == 0
+        assert route_b.vehicules_presents == {1: vehicule}
+        assert vehicule.route_actuelle == "Route_B"
+        # Valeurs lues dans les tableaux de la route, affichées sans ".0"
+        assert isinstance(vehicule.position, float)
+        assert vehicule.position == 100
+        assert str(vehicule) == "Véhicule 1 sur Route_B à position 100m, vitesse 50km/h"
+        assert repr(vehicule) == (
+            "Vehicule(identifiant=1, route_actuelle='Route_B', position=100, vitesse=50)"
+        )
+    
+    def test_mettre_a_jour_vehicules_route_vide(self, caplog, make_route):
         """Test la mise à jour sur une route vide (gestion d'erreur)."""
-        route = Route("Route_Vide", 1000, 90)
+        route = make_route("Route_Vide", 1000, 90)
         
-        with patch('sys.stdout', new_callable=StringIO) as mock_stdout:
-            vehicules_sortis = route.mettre_a_jour_vehicules()
+        vehicules_sortis = route.mettre_a_jour_vehicules()
         
         assert vehicules_sortis == []
-        output = mock_stdout.getvalue()
+        output = caplog.text
         assert "[ERREUR MISE À JOUR]" in output
         assert "aucun véhicule" in output.lower()
     
-    def test_ajouter_feu_rouge_position_invalide_negative(self):
+    def test_ajouter_feu_rouge_position_invalide_negative(self, caplog, make_route):
         """Test l'ajout d'un feu rouge avec position négative (gestion d'erreur)."""
-        route = Route("Route_A", 1000, 90)
+        route = make_route()
         feu = FeuRouge(cycle=5)
         
-        with patch('sys.stdout', new_callable=StringIO) as mock_stdout:
-            route.ajouter_feu_rouge(feu, position=-50)
+        route.ajouter_feu_rouge(feu, position=-50)
         
-        output = mock_stdout.getvalue()
+        output = caplog.text
         assert "[ERREUR AJOUT FEU]" in output
         assert "position du feu invalide" in output.lower()
     
-    def test_ajouter_feu_rouge_position_invalide_trop_grande(self):
+    def test_ajouter_feu_rouge_position_invalide_trop_grande(self, caplog, make_route):
         """Test l'ajout d'un feu rouge avec position trop grande (gestion d'erreur)."""
-        route = Route("Route_A", 1000, 90)
+        route = make_route()
         feu = FeuRouge(cycle=5)
         
-        with patch('sys.stdout', new_callable=StringIO) as mock_stdout:
-            route.ajouter_feu_rouge(feu, position=1500)
+        route.ajouter_feu_rouge(feu, position=1500)
         
-        output = mock_stdout.getvalue()
+        output = caplog.text
         assert "[ERREUR AJOUT FEU]" in output
     
-    def test_ajouter_feu_rouge_position_none(self):
+    def test_ajouter_feu_rouge_position_none(self, caplog, make_route):
         """Test l'ajout d'un feu rouge avec position None (doit utiliser la fin)."""
-        route = Route("Route_A", 1000, 90)
+        route = make_route()
         feu = FeuRouge(cycle=5)
+        caplog.set_level(logging.INFO, logger="models.route")
         
-        with patch('sys.stdout', new_callable=StringIO) as mock_stdout:
-            route.ajouter_feu_rouge(feu, position=None)
+        route.ajouter_feu_rouge(feu, position=None)
         
         # Vérifie que le feu est ajouté à la fin de la route
         assert 1000 in route.feux_rouges
         assert route.feux_rouges[1000] == feu
-        output = mock_stdout.getvalue()
+        output = caplog.text
         assert "Feu rouge ajouté" in output
     
-    def test_ajouter_feu_rouge_remplacement(self):
+    def test_ajouter_feu_rouge_remplacement(self, caplog, make_route):
         """Test l'ajout d'un feu rouge qui remplace un feu existant."""
-        route = Route("Route_A", 1000, 90)
+        route = make_route()
         feu1 = FeuRouge(cycle=5)
         feu2 = FeuRouge(cycle=10)
         
@@ -150,69 +167,68 @@ class TestRouteComplet:
         route.ajouter_feu_rouge(feu1, position=500)
         
         # Deuxième feu à la même position - devrait remplacer
-        with patch('sys.stdout', new_callable=StringIO) as mock_stdout:
-            route.ajouter_feu_rouge(feu2, position=500)
+        route.ajouter_feu_rouge(feu2, position=500)
         
-        output = mock_stdout.getvalue()
+        output = caplog.text
         assert "Remplacement du feu existant" in output
         assert route.feux_rouges[500] == feu2  # Le deuxième feu a remplacé le premier
     
-    def test_doit_arreter_vehicule_feu_rouge(self):
+    def test_doit_arreter_vehicule_feu_rouge(self, make_route, make_vehicule):
         """Test la détection d'arrêt pour un feu rouge."""
-        route = Route("Route_A", 1000, 90)
+        route = make_route()
         feu = FeuRouge(cycle=5)
         route.ajouter_feu_rouge(feu, position=500)
         
-        vehicule = Vehicule(1, "Route_A", position=400, vitesse=50)
+        vehicule = make_vehicule(position=400)
         
         # Le véhicule veut avancer de 200m (de 400 à 600), donc traverse le feu à 500
         doit_arreter = route._doit_arreter_vehicule(vehicule, 200)
         
         assert doit_arreter == True  # Doit s'arrêter car feu rouge
     
-    def test_doit_arreter_vehicule_feu_vert(self):
+    def test_doit_arreter_vehicule_feu_vert(self, make_route, make_vehicule):
         """Test la détection d'arrêt pour un feu vert (ne doit pas s'arrêter)."""
-        route = Route("Route_A", 1000, 90)
+        route = make_route()
         feu = FeuRouge(cycle=5)
         feu.etat_actuel = 'vert'  # Forcer feu vert
         route.ajouter_feu_rouge(feu, position=500)
         
-        vehicule = Vehicule(1, "Route_A", position=400, vitesse=50)
+        vehicule = make_vehicule(position=400)
         
         doit_arreter = route._doit_arreter_vehicule(vehicule, 200)
         
         assert doit_arreter == False  # Ne doit pas s'arrêter car feu vert
     
-    def test_doit_arreter_vehicule_feu_orange(self):
+    def test_doit_arreter_vehicule_feu_orange(self, make_route, make_vehicule):
         """Test la détection d'arrêt pour un feu orange (doit s'arrêter)."""
-        route = Route("Route_A", 1000, 90)
+        route = make_route()
         feu = FeuRouge(cycle=5)
         feu.etat_actuel = 'orange'  # Forcer feu orange
         route.ajouter_feu_rouge(feu, position=500)
         
-        vehicule = Vehicule(1, "Route_A", position=400, vitesse=50)
+        vehicule = make_vehicule(position=400)
         
         doit_arreter = route._doit_arreter_vehicule(vehicule, 200)
         
         assert doit_arreter == True  # Doit s'arrêter car feu orange
     
-    def test_doit_arreter_vehicule_pas_de_feu(self):
+    def test_doit_arreter_vehicule_pas_de_feu(self, make_route, make_vehicule):
         """Test la détection d'arrêt sans feu (ne doit pas s'arrêter)."""
-        route = Route("Route_A", 1000, 90)  # Pas de feu
+        route = make_route()  # Pas de feu
         
-        vehicule = Vehicule(1, "Route_A", position=400, vitesse=50)
+        vehicule = make_vehicule(position=400)
         
         doit_arreter = route._doit_arreter_vehicule(vehicule, 200)
         
         assert doit_arreter == False  # Pas de feu, donc pas d'arrêt
     
-    def test_get_distance_avant_obstacle_feu_rouge(self):
+    def test_get_distance_avant_obstacle_feu_rouge(self, make_route, make_vehicule):
         """Test le calcul de distance avec feu rouge."""
-        route = Route("Route_A", 1000, 90)
+        route = make_route()
         feu = FeuRouge(cycle=5)
         route.ajouter_feu_rouge(feu, position=500)
         
-        vehicule = Vehicule(1, "Route_A", position=400, vitesse=50)
+        vehicule = make_vehicule(position=400)
         
         distance_max = 200  # Veut aller jusqu'à 600
         distance_reelle = route._get_distance_avant_obstacle(vehicule, distance_max)
@@ -220,14 +236,14 @@ class TestRouteComplet:
         # Doit s'arrêter avant le feu (500 - 400 - 5 = 95m)
         assert distance_reelle == 95.0
     
-    def test_get_distance_avant_obstacle_feu_vert(self):
+    def test_get_distance_avant_obstacle_feu_vert(self, make_route, make_vehicule):
         """Test le calcul de distance avec feu vert."""
-        route = Route("Route_A", 1000, 90)
+        route = make_route()
         feu = FeuRouge(cycle=5)
         feu.etat_actuel = 'vert'  # Forcer feu vert
         route.ajouter_feu_rouge(feu, position=500)
         
-        vehicule = Vehicule(1, "Route_A", position=400, vitesse=50)
+        vehicule = make_vehicule(position=400)
         
         distance_max = 200
         distance_reelle = route._get_distance_avant_obstacle(vehicule, distance_max)
@@ -235,11 +251,11 @@ class TestRouteComplet:
         # Peut avancer normalement (jusqu'à la fin de la route ou distance_max)
         assert distance_reelle == 200  # Pas d'obstacle
     
-    def test_get_distance_avant_obstacle_fin_route(self):
+    def test_get_distance_avant_obstacle_fin_route(self, make_route, make_vehicule):
         """Test le calcul de distance avec fin de route."""
-        route = Route("Route_A", 1000, 90)
+        route = make_route()
         
-        vehicule = Vehicule(1, "Route_A", position=900, vitesse=50)
+        vehicule = make_vehicule(position=900)
         
         distance_max = 200  # Veut aller jusqu'à 1100, mais route finit à 1000
         distance_reelle = route._get_distance_avant_obstacle(vehicule, distance_max)
@@ -247,9 +263,9 @@ class TestRouteComplet:
         # Doit s'arrêter à la fin de la route (1000 - 900 = 100m)
         assert distance_reelle == 100.0
     
-    def test_get_distance_avant_obstacle_multiple_feux(self):
+    def test_get_distance_avant_obstacle_multiple_feux(self, make_route, make_vehicule):
         """Test le calcul de distance avec plusieurs feux."""
-        route = Route("Route_A", 1000, 90)
+        route = make_route()
         
         # Deux feux rouges
         feu1 = FeuRouge(cycle=5)
@@ -257,7 +273,7 @@ class TestRouteComplet:
         route.ajouter_feu_rouge(feu1, position=300)
         route.ajouter_feu_rouge(feu2, position=600)
         
-        vehicule = Vehicule(1, "Route_A", position=200, vitesse=50)
+        vehicule = make_vehicule(position=200)
         
         distance_max = 500  # Veut aller jusqu'à 700
         distance_reelle = route._get_distance_avant_obstacle(vehicule, distance_max)
@@ -265,10 +281,29 @@ class TestRouteComplet:
         # Doit s'arrêter au premier feu (300 - 200 - 5 = 95m)
         assert distance_reelle == 95.0
     
-    def test_mettre_a_jour_vehicules_avec_dt(self):
+    def test_get_distance_avant_obstacle_feu_vert_puis_rouge(self, make_route, make_vehicule):
+        """Test le calcul de distance quand le premier feu est vert et le suivant rouge."""
+        route = make_route()
+        
+        feu_vert = FeuRouge(cycle=5)
+        feu_vert.etat_actuel = 'vert'
+        feu_rouge = FeuRouge(cycle=5)
+        # Ajout dans le désordre : la route doit garder les positions triées
+        route.ajouter_feu_rouge(feu_rouge, position=600)
+        route.ajouter_feu_rouge(feu_vert, position=300)
+        
+        vehicule = make_vehicule(position=200)
+        
+        distance_reelle = route._get_distance_avant_obstacle(vehicule, 500)
+        
+        # Passe le feu vert, s'arrête avant le feu rouge (600 - 200 - 5 = 395m)
+        assert distance_reelle == 395.0
+        assert route._doit_arreter_vehicule(vehicule, 500) == True
+    
+    def test_mettre_a_jour_vehicules_avec_dt(self, make_route, make_vehicule):
         """Test la mise à jour des véhicules avec dt personnalisé."""
-        route = Route("Route_A", 1000, 90)
-        vehicule = Vehicule(1, "Route_A", position=0, vitesse=36)  # 36 km/h = 10 m/s
+        route = make_route()
+        vehicule = make_vehicule(vitesse=36)  # 36 km/h = 10 m/s
         route.ajouter_vehicule(vehicule)
         
         # Mise à jour avec dt=2 secondes
@@ -278,13 +313,13 @@ class TestRouteComplet:
         assert vehicule.position == 20.0
         assert vehicules_sortis == []
     
-    def test_mettre_a_jour_vehicules_avec_feu(self):
+    def test_mettre_a_jour_vehicules_avec_feu(self, make_route, make_vehicule):
         """Test la mise à jour des véhicules avec feu rouge."""
-        route = Route("Route_A", 1000, 90)
+        route = make_route()
         feu = FeuRouge(cycle=5)
         route.ajouter_feu_rouge(feu, position=100)
         
-        vehicule = Vehicule(1, "Route_A", position=0, vitesse=72)  # 72 km/h = 20 m/s
+        vehicule = make_vehicule(vitesse=72)  # 72 km/h = 20 m/s
         route.ajouter_vehicule(vehicule)
         
         # Mise à jour avec dt=10 secondes
@@ -295,9 +330,9 @@ class TestRouteComplet:
         assert vehicule.position > 0  # A avancé un peu
         assert vehicules_sortis == []
     
-    def test_get_nombre_feux(self):
+    def test_get_nombre_feux(self, make_route):
         """Test la récupération du nombre de feux."""
-        route = Route("Route_A", 1000, 90)
+        route = make_route()
         
         # Aucun feu initialement
         assert route.get_nombre_feux() == 0
@@ -312,9 +347,9 @@ class TestRouteComplet:
         route.ajouter_feu_rouge(feu2, position=800)
         assert route.get_nombre_feux() == 2
     
-    def test_get_etat_feux(self):
+    def test_get_etat_feux(self, make_route):
         """Test la récupération de l'état des feux."""
-        route = Route("Route_A", 1000, 90)
+        route = make_route()
         
         feu1 = FeuRouge(cycle=5)
         feu2 = FeuRouge(cycle=10)
@@ -328,15 +363,103 @@ class TestRouteComplet:
         assert len(etat_feux) == 2
         assert etat_feux[500] == 'rouge'
         assert etat_feux[800] == 'vert'
+    
+    def test_get_etat_feux_suit_les_changements(self, make_route):
+        """Test que l'état des feux reflète les changements après l'ajout."""
+        route = make_route()
+        feu = FeuRouge(cycle=5)
+        route.ajouter_feu_rouge(feu, position=500)
+        
+        feu.avancer_temps(5)
+        assert route.get_etat_feux() == {500: 'vert'}
+        
+        feu.etat_actuel = 'orange'
+        assert route.get_etat_feux() == {500: 'orange'}
+        
+        # Le feu remplacé ne met plus à jour la route
+        route.ajouter_feu_rouge(FeuRouge(cycle=5), position=500)
+        feu.etat_actuel = 'vert'
+        assert route.get_etat_feux() == {500: 'rouge'}
+
+    @pytest.mark.parametrize("duree, dt", [(3.0, 1.0), (12.0, 1.0), (0.3, 0.1), (2.5, 0.1)],
+                             ids=["dt_entier_court", "dt_entier_long", "dt_0.1_court", "dt_0.1_long"])
+    def test_avancer_equivalent_pas_a_pas(self, make_route, make_vehicule, duree, dt):
+        """Test qu'avancer(duree, dt) équivaut à round(duree / dt) appels à mettre_a_jour_vehicules(dt)."""
+        routes = []
+        for nom in ("Route_A", "Route_B"):
+            route = make_route(nom=nom, longueur=100)
+            route.ajouter_feu_rouge(FeuRouge(cycle=1), position=60)
+            for i, (position, vitesse) in enumerate([(0, 90), (40, 50), (57, 30), (95, 120)]):
+                route.ajouter_vehicule(make_vehicule(i, nom, position=position, vitesse=vitesse))
+            routes.append(route)
+        route_pas_a_pas, route_avancee = routes
+
+        sortis_pas_a_pas = []
+        for _ in range(round(duree / dt)):
+            sortis_pas_a_pas += route_pas_a_pas.mettre_a_jour_vehicules(dt)
+        sortis_avancee = route_avancee.avancer(duree, dt)
+
+        # Seul l'ordre des véhicules sortis peut différer
+        assert (sorted(v.identifiant for v in sortis_avancee)
+                == sorted(v.identifiant for v in sortis_pas_a_pas))
+        assert ({i: v.position for i, v in route_avancee.vehicules_presents.items()}
+                == pytest.approx({i: v.position for i, v in route_pas_a_pas.vehicules_presents.items()}))
+        feu_pas_a_pas = route_pas_a_pas.feux_rouges[60]
+        feu_avance = route_avancee.feux_rouges[60]
+        assert feu_avance.etat_actuel == feu_pas_a_pas.etat_actuel
+        assert feu_avance.temps_ecoule == pytest.approx(feu_pas_a_pas.temps_ecoule)
+        assert route_avancee.get_etat_feux() == route_pas_a_pas.get_etat_feux()
+
+    def test_avancer_feu_partage_entre_deux_positions(self, make_route, make_vehicule):
+        """Test qu'un même feu placé à deux positions avance comme avec des appels pas à pas."""
+        routes, feux = [], []
+        for nom in ("Route_A", "Route_B"):
+            route = make_route(nom=nom, longueur=100)
+            feu = FeuRouge(cycle=1)
+            route.ajouter_feu_rouge(feu, position=40)
+            route.ajouter_feu_rouge(feu, position=80)
+            route.ajouter_vehicule(make_vehicule(1, nom, position=10, vitesse=36))
+            routes.append(route)
+            feux.append(feu)
+        route_pas_a_pas, route_avancee = routes
+        feu_pas_a_pas, feu_avance = feux
+
+        sortis_pas_a_pas = []
+        for _ in range(2):
+            sortis_pas_a_pas += route_pas_a_pas.mettre_a_jour_vehicules(1.0)
+        sortis_avancee = route_avancee.avancer(2, dt=1.0)
 
+        assert sortis_avancee == sortis_pas_a_pas == []
+        # Le feu avance deux fois par pas, une fois par position : 4 s au total
+        assert (feu_avance.etat_actuel, feu_avance.temps_ecoule) == ('vert', 0.0)
+        assert (feu_pas_a_pas.etat_actuel, feu_pas_a_pas.temps_ecoule) == ('vert', 0.0)
+        assert route_avancee.get_etat_feux() == route_pas_a_pas.get_etat_feux()
+        assert route_avancee.vehicules_presents[1].position == route_pas_a_pas.vehicules_presents[1].position
+
+    @pytest.mark.parametrize("duree, dt", [(10, 0), (10, -1), (-1, 1), (1.05, 0.1)],
+                             ids=["dt_nul", "dt_negatif", "duree_negative", "pas_non_entier"])
+    def test_avancer_parametres_invalides(self, make_route, make_vehicule, caplog, duree, dt):
+        """Test qu'avancer avec des paramètres invalides ne fait rien et journalise un avertissement."""
+        route = make_route()
+        vehicule = make_vehicule(position=100)
+        route.ajouter_vehicule(vehicule)
+
+        with caplog.at_level(logging.WARNING, logger="models.route"):
+            assert route.avancer(duree, dt) == []
+
+        assert "[ERREUR AVANCER ROUTE]" in caplog.text
+        assert vehicule.position == 100
+
+
+@pytest.mark.integration
 class TestRouteIntegration:
     """
     Tests d'intégration pour la classe Route
     """
     
-    def test_route_complete_avec_feux_et_vehicules(self):
+    def test_route_complete_avec_feux_et_vehicules(self, make_route, make_vehicule):
         """Test complet d'une route avec feux et véhicules."""
-        route = Route("Route_Complete", 2000, 90)
+        route = make_route("Route_Complete", 2000, 90)
         
         # Ajouter plusieurs feux
         feu1 = FeuRouge(cycle={'rouge': 10, 'vert': 20, 'orange': 5})
@@ -345,8 +468,8 @@ class TestRouteIntegration:
         route.ajouter_feu_rouge(feu2, position=1200)
         
         # Ajouter plusieurs véhicules
-        vehicule1 = Vehicule(1, "Route_Complete", position=0, vitesse=50)
-        vehicule2 = Vehicule(2, "Route_Complete", position=100, vitesse=60)
+        vehicule1 = make_vehicule(route_actuelle="Route_Complete")
+        vehicule2 = make_vehicule(identifiant=2, route_actuelle="Route_Complete", position=100, vitesse=60)
         route.ajouter_vehicule(vehicule1)
         route.ajouter_vehicule(vehicule2)
         
@@ -363,7 +486,31 @@ class TestRouteIntegration:
         assert vehicule1.position > 0
         assert vehicule2.position > 100
         assert route.get_nombre_vehicules() == 2
+    
+    def test_mettre_a_jour_routes_equivalent_par_route(self):
+        """Test que la mise à jour groupée donne le même résultat que route par route."""
+        def construire():
+            route_a = Route("Route_A", 1000, 90)
+            route_a.ajouter_feu_rouge(FeuRouge(cycle=5), position=300)
+            route_a.ajouter_vehicule(Vehicule(1, "Route_A", position=200, vitesse=72))
+            route_a.ajouter_vehicule(Vehicule(2, "Route_A", position=950, vitesse=90))
+            route_b = Route("Route_B", 500, 50)
+            route_b.ajouter_vehicule(Vehicule(3, "Route_B", position=0, vitesse=36))
+            return [route_a, route_b]
+        
+        routes_groupees = construire()
+        routes_separees = construire()
+        
+        sortis_groupes = mettre_a_jour_routes(routes_groupees, dt=10.0)
+        sortis_separes = [route.mettre_a_jour_vehicules(dt=10.0) for route in routes_separees]
+        
+        assert [[v.identifiant for v in sortis] for sortis in sortis_groupes] == [[2], []]
+        assert [[v.identifiant for v in sortis] for sortis in sortis_separes] == [[2], []]
+        for groupee, separee in zip(routes_groupees, routes_separees):
+            assert ({i: v.position for i, v in groupee.vehicules_presents.items()}
+                    == {i: v.position for i, v in separee.vehicules_presents.items()})
 
 
 if __name__ == '__main__':
-    pytest.main([__file__, "-v"])
\ No newline at end of file
+    # Propager le code de retour de pytest au shell
+    raise SystemExit(pytest.main([__file__, "-v", "-p", "no:cacheprovider"]))
\ No newline at end of file
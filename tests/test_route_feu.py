@@ -13,6 +13,9 @@ from models.route import Route
 from models.feuRouge import FeuRouge
 from models.vehicule import Vehicule
 
+# Tout le module combine Route, FeuRouge et Vehicule
+pytestmark = pytest.mark.integration
+
 
 class TestRouteFeuIntegration:
     """
@@ -35,8 +38,7 @@ class TestRouteFeuIntegration:
         route.ajouter_vehicule(vehicule)
         
         # Simuler 15 secondes de déplacement
-        for _ in range(15):
-            route.mettre_a_jour_vehicules(dt=1.0)
+        route.avancer(15.0, dt=1.0)
         
         # Vérifier que le véhicule s'est arrêté avant le feu
         # Avec marge de sécurité, il devrait s'arrêter vers 195m
@@ -101,11 +103,8 @@ class TestRouteFeuIntegration:
         vehicule = Vehicule(1, "Route_test", position=0, vitesse=18)  # 18 km/h = 5 m/s
         route.ajouter_vehicule(vehicule)
         
-        # Simuler jusqu'à ce que le véhicule s'arrête
-        for _ in range(20):
-            route.mettre_a_jour_vehicules(dt=1.0)
-            if vehicule.position >= 45:  # Proche du feu
-                break
+        # Simuler 20 secondes : le véhicule s'arrête avant le feu
+        route.avancer(20.0, dt=1.0)
         
         # Vérifier la marge de sécurité (s'arrête avant 50m)
         assert vehicule.position < 50
@@ -182,4 +181,5 @@ class TestRouteFeuPytest:
     
   
 if __name__ == '__main__':
-    pytest.main([__file__, "-v"])
\ No newline at end of file
+    # Propager le code de retour de pytest au shell
+    raise SystemExit(pytest.main([__file__, "-v", "-p", "no:cacheprovider"]))
\ No newline at end of file
@@ -18,6 +18,9 @@ from models.reseau import ReseauRoutier
 from models.route import Route
 from models.vehicule import Vehicule
 
+# Tout le module exécute des simulations complètes
+pytestmark = pytest.mark.integration
+
 
 class TestSimulateur:
     """Tests pour la classe Simulateur."""
@@ -28,7 +28,7 @@ class TestVehiculeUnittest(unittest.TestCase):
         self.assertEqual(self.vehicule.route_actuelle, "Route_A")
         self.assertEqual(self.vehicule.position, 100)
         self.assertEqual(self.vehicule.vitesse, 50)
-        self.assertEqual(self.vehicule.historique_routes, ["Route_A"])
+        self.assertEqual(list(self.vehicule.historique_routes), ["Route_A"])
     
    
    
@@ -60,7 +60,7 @@ class TestVehiculeUnittest(unittest.TestCase):
         # Arrange
         ancienne_route = self.vehicule.route_actuelle
         ancienne_position = self.vehicule.position
-        historique_initial = self.vehicule.historique_routes.copy()
+        historique_initial = list(self.vehicule.historique_routes)
         
         # Act
         self.vehicule.changer_de_route("Nouvelle_Route", 200)
@@ -68,7 +68,7 @@ class TestVehiculeUnittest(unittest.TestCase):
         # Assert
         self.assertEqual(self.vehicule.route_actuelle, "Nouvelle_Route")
         self.assertEqual(self.vehicule.position, 200)
-        self.assertEqual(self.vehicule.historique_routes, historique_initial + ["Nouvelle_Route"])
+        self.assertEqual(list(self.vehicule.historique_routes), historique_initial + ["Nouvelle_Route"])
         self.assertEqual(len(self.vehicule.historique_routes), len(historique_initial) + 1)
     
     def test_changer_de_route_position_par_defaut(self):
@@ -111,7 +111,7 @@ class TestVehiculeUnittest(unittest.TestCase):
         self.vehicule.changer_de_route("Route_Trois")
         
         # Assert
-        self.assertEqual(self.vehicule.historique_routes, ["Route_A", "Route_Deux", "Route_Trois"])
+        self.assertEqual(list(self.vehicule.historique_routes), ["Route_A", "Route_Deux", "Route_Trois"])
         self.assertEqual(len(self.vehicule.historique_routes), 3)
     
     def test_vitesse_modifiable(self):
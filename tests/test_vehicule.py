@@ -2,184 +2,106 @@
 Tests complets pour la classe Vehicule - Couverture 100%
 """
 
-import pytest
-import sys
-import os
-from unittest.mock import patch
-from io import StringIO
+from types import MappingProxyType
 
+import pytest
 
 from models.vehicule import Vehicule
 from exceptions import PositionInvalideError, VitesseInvalideError, DistanceInvalideError
 
+# Aucun avertissement n'est attendu : en faire des erreurs
+pytestmark = pytest.mark.filterwarnings("error")
+
+# Arguments valides du constructeur, partagés en lecture seule par les cas d'erreur
+_GOOD = MappingProxyType(dict(identifiant=1, route_actuelle="Route_A", position=100, vitesse=50))
+
+# Positions attendues après avancement d'une distance décimale
+POS_250_75 = pytest.approx(250.75)
+POS_175_5 = pytest.approx(175.5)
+POS_200_5 = pytest.approx(200.5)
+
+
+@pytest.fixture(scope="module")
+def vehicule_initial():
+    """Véhicule jamais modifié, partagé par les tests en lecture seule du module."""
+    return Vehicule(identifiant=1, route_actuelle="Route_Initiale")
+
 
 class TestVehiculeComplet:
     """
     Tests complets pour couvrir 100% de la classe Vehicule
     """
     
-    def test_creation_vehicule_identifiant_negatif(self):
-        """Test la création d'un véhicule avec identifiant négatif (gestion d'erreur)."""
-        with patch('sys.stdout', new_callable=StringIO) as mock_stdout:
-            vehicule = Vehicule(identifiant=-1, route_actuelle="Route_A", position=100, vitesse=50)
-        
-        # Vérifie que l'objet est créé avec des valeurs par défaut
-        assert vehicule.identifiant == 0  # Doit être corrigé à 0
-        assert vehicule.route_actuelle == "Route_A"
-        output = mock_stdout.getvalue()
-        assert "[Erreur]" in output
-        assert "identifiant" in output.lower()
-    
-    def test_creation_vehicule_position_negative(self):
-        """Test la création d'un véhicule avec position négative (gestion d'erreur)."""
-        with patch('sys.stdout', new_callable=StringIO) as mock_stdout:
-            vehicule = Vehicule(identifiant=1, route_actuelle="Route_A", position=-50, vitesse=50)
-        
-        # Vérifie que la position est corrigée à 0
-        assert vehicule.position == 0
-        output = mock_stdout.getvalue()
-        assert "[Erreur]" in output
-        assert "position" in output.lower()
-    
-    def test_creation_vehicule_vitesse_negative(self):
-        """Test la création d'un véhicule avec vitesse négative (gestion d'erreur)."""
-        with patch('sys.stdout', new_callable=StringIO) as mock_stdout:
-            vehicule = Vehicule(identifiant=1, route_actuelle="Route_A", position=100, vitesse=-30)
-        
-        # Vérifie que la vitesse est corrigée à 0
-        assert vehicule.vitesse == 0
-        output = mock_stdout.getvalue()
-        assert "[Erreur]" in output
-        assert "vitesse" in output.lower()
-    
-    def test_creation_vehicule_route_none(self):
-        """Test la création d'un véhicule avec route_actuelle None (gestion d'erreur)."""
-        with patch('sys.stdout', new_callable=StringIO) as mock_stdout:
-            vehicule = Vehicule(identifiant=-1, route_actuelle=None, position=-100, vitesse=-50)
-        
-        # Vérifie les valeurs par défaut
-        assert vehicule.identifiant == 0
-        assert vehicule.route_actuelle == "Route_Inconnue"
-        assert vehicule.position == 0
-        assert vehicule.vitesse == 0
-        output = mock_stdout.getvalue()
-        assert "[Erreur]" in output
-    
-    def test_avancer_distance_negative(self):
-        """Test l'avancement avec distance négative (gestion d'erreur)."""
-        vehicule = Vehicule(identifiant=1, route_actuelle="Route_A", position=100, vitesse=50)
-        
-        with patch('sys.stdout', new_callable=StringIO) as mock_stdout:
-            vehicule.avancer(-50)
-        
-        # La position ne doit pas changer
-        assert vehicule.position == 100
-        output = mock_stdout.getvalue()
-        assert "[Erreur]" in output
-        assert "distance" in output.lower()
-    
-    def test_avancer_vitesse_negative(self):
-        """Test l'avancement quand la vitesse est négative (gestion d'erreur)."""
-        vehicule = Vehicule(identifiant=1, route_actuelle="Route_A", position=100, vitesse=50)
-        vehicule.vitesse = -10  # Forcer une vitesse négative
-        
-        with patch('sys.stdout', new_callable=StringIO) as mock_stdout:
-            vehicule.avancer(50)
-        
-        # La position ne doit pas changer
-        assert vehicule.position == 100
-        output = mock_stdout.getvalue()
-        assert "[Erreur]" in output
-        assert "vitesse" in output.lower()
-    
-
-    def test_changer_de_route_nom_vide(self):
-        """Test le changement de route avec un nom vide (gestion d'erreur)."""
-        vehicule = Vehicule(identifiant=1, route_actuelle="Route_A", position=100, vitesse=50)
-        
-        with patch('sys.stdout', new_callable=StringIO) as mock_stdout:
-            vehicule.changer_de_route("", 200)
-        
-        # La route et position ne doivent pas changer
-        assert vehicule.route_actuelle == "Route_A"
-        assert vehicule.position == 100
-        output = mock_stdout.getvalue()
-        assert "[Erreur]" in output
-        assert "vide" in output.lower()
-    
-    def test_changer_de_route_position_negative(self):
-        """Test le changement de route avec position négative (gestion d'erreur)."""
-        vehicule = Vehicule(identifiant=1, route_actuelle="Route_A", position=100, vitesse=50)
-        
-        with patch('sys.stdout', new_callable=StringIO) as mock_stdout:
-            vehicule.changer_de_route("Nouvelle_Route", -50)
-        
-        # La route et position ne doivent pas changer
-        assert vehicule.route_actuelle == "Route_A"
-        assert vehicule.position == 100
-        output = mock_stdout.getvalue()
+    @pytest.mark.parametrize("kwargs,attendus,mot_cle", [
+        ({**_GOOD, "identifiant": -1},
+         {"identifiant": 0, "route_actuelle": "Route_A"}, "identifiant"),
+        ({**_GOOD, "position": -50},
+         {"position": 0}, "position"),
+        ({**_GOOD, "vitesse": -30},
+         {"vitesse": 0}, "vitesse"),
+        ({**_GOOD, "identifiant": -1, "route_actuelle": None, "position": -100, "vitesse": -50},
+         {"identifiant": 0, "route_actuelle": "Route_Inconnue", "position": 0, "vitesse": 0}, None),
+    ], ids=["identifiant_negatif", "position_negative", "vitesse_negative", "tout_invalide"])
+    def test_creation_vehicule_invalide(self, capsys, kwargs, attendus, mot_cle):
+        """Test la création d'un véhicule avec des valeurs invalides (gestion d'erreur)."""
+        vehicule = Vehicule(**kwargs)
+        
+        # Vérifie que les valeurs invalides sont corrigées
+        for attribut, valeur in attendus.items():
+            assert getattr(vehicule, attribut) == valeur
+        output = capsys.readouterr().out
         assert "[Erreur]" in output
-        assert "position" in output.lower()
-    
-    def test_changer_de_route_nom_none(self):
-        """Test le changement de route avec nom None (gestion d'erreur)."""
-        vehicule = Vehicule(identifiant=1, route_actuelle="Route_A", position=100, vitesse=50)
-        
-        with patch('sys.stdout', new_callable=StringIO) as mock_stdout:
-            vehicule.changer_de_route(None, 200)
-        
-        # La route et position ne doivent pas changer
+        if mot_cle:
+            assert mot_cle in output.lower()
+    
+    @pytest.mark.parametrize("vitesse,methode,args,mot_cle", [
+        (50, "avancer", (-50,), "distance"),
+        (-10, "avancer", (50,), "vitesse"),  # Vitesse négative forcée après création
+        (50, "changer_de_route", ("", 200), "vide"),
+        (50, "changer_de_route", ("Nouvelle_Route", -50), "position"),
+        (50, "changer_de_route", (None, 200), None),
+    ], ids=["avancer_distance_negative", "avancer_vitesse_negative", "route_nom_vide", "route_position_negative", "route_nom_none"])
+    def test_methode_arguments_invalides(self, make_vehicule, capsys, vitesse, methode, args, mot_cle):
+        """Test avancer et changer_de_route avec des arguments invalides (gestion d'erreur)."""
+        vehicule = make_vehicule(position=100)
+        vehicule.vitesse = vitesse
+        
+        getattr(vehicule, methode)(*args)
+        
+        # La route et la position ne doivent pas changer
         assert vehicule.route_actuelle == "Route_A"
         assert vehicule.position == 100
-        output = mock_stdout.getvalue()
+        output = capsys.readouterr().out
         assert "[Erreur]" in output
+        if mot_cle:
+            assert mot_cle in output.lower()
     
-    def test_avancer_success_scenario(self):
+    def test_avancer_success_scenario(self, make_vehicule):
         """Test scenario normal d'avancement sans erreur."""
-        vehicule = Vehicule(identifiant=1, route_actuelle="Route_A", position=100, vitesse=50)
+        vehicule = make_vehicule(position=100)
         
-        # Pas de capture stdout car pas d'erreur attendue
         vehicule.avancer(150.75)
         
-        assert vehicule.position == 250.75
+        assert vehicule.position == POS_250_75
     
-    def test_changer_de_route_success_scenario(self):
+    def test_changer_de_route_success_scenario(self, make_vehicule):
         """Test scenario normal de changement de route sans erreur."""
-        vehicule = Vehicule(identifiant=1, route_actuelle="Route_A", position=100, vitesse=50)
+        vehicule = make_vehicule(position=100)
         
-        # Pas de capture stdout car pas d'erreur attendue
         vehicule.changer_de_route("Route_B", 50)
         
         assert vehicule.route_actuelle == "Route_B"
         assert vehicule.position == 50
-        assert vehicule.historique_routes == ["Route_A", "Route_B"]
-    
-    def test_vehicule_avec_vitesse_zero(self):
-        """Test le comportement avec vitesse zéro."""
-        vehicule = Vehicule(identifiant=1, route_actuelle="Route_A", position=100, vitesse=0)
-        
-        vehicule.avancer(50)
-        
-        assert vehicule.position == 150  # Doit avancer même avec vitesse 0
+        assert list(vehicule.historique_routes) == ["Route_A", "Route_B"]
     
-    def test_vehicule_avec_position_zero(self):
-        """Test le comportement avec position zéro."""
-        vehicule = Vehicule(identifiant=1, route_actuelle="Route_A", position=0, vitesse=50)
-        
-        vehicule.avancer(100)
-        
-        assert vehicule.position == 100
-    
-    def test_historique_routes_initial(self):
+    def test_historique_routes_initial(self, vehicule_initial):
         """Test que l'historique des routes est initialisé correctement."""
-        vehicule = Vehicule(identifiant=1, route_actuelle="Route_Initiale")
-        
-        assert vehicule.historique_routes == ["Route_Initiale"]
-        assert len(vehicule.historique_routes) == 1
+        assert list(vehicule_initial.historique_routes) == ["Route_Initiale"]
+        assert len(vehicule_initial.historique_routes) == 1
     
-    def test_multiple_changements_route(self):
+    def test_multiple_changements_route(self, make_vehicule):
         """Test de multiples changements de route successifs."""
-        vehicule = Vehicule(identifiant=1, route_actuelle="Route_A")
+        vehicule = make_vehicule()
         
         vehicule.changer_de_route("Route_B", 10)
         vehicule.changer_de_route("Route_C", 20)
@@ -187,35 +109,33 @@ class TestVehiculeComplet:
         
         assert vehicule.route_actuelle == "Route_D"
         assert vehicule.position == 30
-        assert vehicule.historique_routes == ["Route_A", "Route_B", "Route_C", "Route_D"]
+        assert list(vehicule.historique_routes) == ["Route_A", "Route_B", "Route_C", "Route_D"]
     
-    def test_repr_apres_modifications(self):
+    def test_repr_apres_modifications(self, make_vehicule):
         """Test la représentation technique après modifications."""
-        vehicule = Vehicule(identifiant=1, route_actuelle="Route_A", position=0, vitesse=30)
+        vehicule = make_vehicule(vitesse=30)
         
         vehicule.avancer(150)
         vehicule.vitesse = 60
         
         representation = repr(vehicule)
         
-        assert "identifiant=1" in representation
-        assert "route_actuelle='Route_A'" in representation
-        assert "position=150" in representation
-        assert "vitesse=60" in representation
+        attendus = ("identifiant=1", "route_actuelle='Route_A'", "position=150", "vitesse=60")
+        manquants = [texte for texte in attendus if texte not in representation]
+        assert not manquants, manquants
     
-    def test_str_apres_modifications(self):
+    def test_str_apres_modifications(self, make_vehicule):
         """Test la représentation textuelle après modifications."""
-        vehicule = Vehicule(identifiant=1, route_actuelle="Route_A", position=0, vitesse=30)
+        vehicule = make_vehicule(vitesse=30)
         
         vehicule.avancer(150)
         vehicule.vitesse = 60
         
         representation = str(vehicule)
         
-        assert "Véhicule 1" in representation
-        assert "Route_A" in representation
-        assert "150m" in representation
-        assert "60km/h" in representation
+        attendus = ("Véhicule 1", "Route_A", "150m", "60km/h")
+        manquants = [texte for texte in attendus if texte not in representation]
+        assert not manquants, manquants
 
 
 class TestVehiculeEdgeCases:
@@ -223,39 +143,33 @@ class TestVehiculeEdgeCases:
     Tests des cas limites pour la classe Vehicule
     """
     
-    def test_avancer_distance_zero(self):
-        """Test avancer avec distance zéro."""
-        vehicule = Vehicule(identifiant=1, route_actuelle="Route_A", position=100, vitesse=50)
-        
-        vehicule.avancer(0)
-        
-        assert vehicule.position == 100  # Position inchangée
-    
-    def test_avancer_distance_float(self):
-        """Test avancer avec distance décimale."""
-        vehicule = Vehicule(identifiant=1, route_actuelle="Route_A", position=100, vitesse=50)
-        
-        vehicule.avancer(75.5)
-        
-        assert vehicule.position == 175.5
-    
-    def test_changer_de_route_meme_route(self):
+    def test_changer_de_route_meme_route(self, make_vehicule):
         """Test changement vers la même route."""
-        vehicule = Vehicule(identifiant=1, route_actuelle="Route_A", position=100, vitesse=50)
+        vehicule = make_vehicule(position=100)
         
         vehicule.changer_de_route("Route_A", 50)
         
         # Doit fonctionner et ajouter à l'historique
         assert vehicule.route_actuelle == "Route_A"
         assert vehicule.position == 50
-        assert vehicule.historique_routes == ["Route_A", "Route_A"]
+        assert list(vehicule.historique_routes) == ["Route_A", "Route_A"]
+
+    def test_historique_routes_borne(self, make_vehicule):
+        """Test que l'historique ne conserve que les dernières routes."""
+        vehicule = make_vehicule(route_actuelle="Route_0")
+
+        for i in range(1, Vehicule.TAILLE_HISTORIQUE + 10):
+            vehicule.changer_de_route(f"Route_{i}")
+
+        assert len(vehicule.historique_routes) == Vehicule.TAILLE_HISTORIQUE
+        assert vehicule.historique_routes[-1] == vehicule.route_actuelle
     
-    def test_vehicule_sans_route_actuelle(self):
+    def test_vehicule_sans_route_actuelle(self, make_vehicule):
         """Test création avec route_actuelle vide string."""
-        vehicule = Vehicule(identifiant=1, route_actuelle="", position=100, vitesse=50)
+        vehicule = make_vehicule(route_actuelle="", position=100)
         
         assert vehicule.route_actuelle == ""
-        assert vehicule.historique_routes == [""]
+        assert list(vehicule.historique_routes) == [""]
 
 
 # Tests paramétrés pour couvrir différentes combinaisons
@@ -269,7 +183,7 @@ class TestVehiculeParametre:
         (999, "Route_B", 1000, 120),
         (0, "Route_C", 50, 30),
         (42, "Route_D", 75.5, 85.5),
-    ])
+    ], ids=["position_et_vitesse_nulles", "grandes_valeurs", "identifiant_zero", "valeurs_decimales"])
     def test_creation_parametree_valide(self, identifiant, route, position, vitesse):
         """Test création de véhicule avec différents paramètres valides."""
         vehicule = Vehicule(identifiant, route, position, vitesse)
@@ -279,20 +193,24 @@ class TestVehiculeParametre:
         assert vehicule.position == position
         assert vehicule.vitesse == vitesse
     
-    @pytest.mark.parametrize("distance_avancement,position_attendue", [
-        (0, 100),
-        (50, 150),
-        (100.5, 200.5),
-        (1000, 1100),
-    ])
-    def test_avancer_parametre(self, distance_avancement, position_attendue):
-        """Test avancement avec différentes distances."""
-        vehicule = Vehicule(identifiant=1, route_actuelle="Route_A", position=100, vitesse=50)
+    @pytest.mark.parametrize("position_initiale,vitesse,distance_avancement,position_attendue", [
+        (100, 50, 0, 100),  # Distance nulle : position inchangée
+        (100, 50, 50, 150),
+        (100, 50, 75.5, POS_175_5),
+        (100, 50, 100.5, POS_200_5),
+        (100, 50, 1000, 1100),
+        (100, 0, 50, 150),  # Doit avancer même avec vitesse 0
+        (0, 50, 100, 100),
+    ], ids=["distance_nulle", "distance_50", "distance_75_5", "distance_100_5", "distance_1000", "vitesse_nulle", "depart_zero"])
+    def test_avancer_parametre(self, make_vehicule, position_initiale, vitesse,
+                               distance_avancement, position_attendue):
+        """Test avancement avec différentes positions, vitesses et distances."""
+        vehicule = make_vehicule(position=position_initiale, vitesse=vitesse)
         
         vehicule.avancer(distance_avancement)
         
         assert vehicule.position == position_attendue
 
-
 if __name__ == '__main__':
-    pytest.main([__file__, "-v"])
\ No newline at end of file
+    # Propager le code de retour de pytest au shell
+    raise SystemExit(pytest.main([__file__, "-v", "-p", "no:cacheprovider"]))
\ No newline at end of file